@@ -63,6 +63,15 @@ class TestBlendHexHappy:
         assert result.startswith("#")
         assert len(result) == 7
 
+    def test_channels_do_not_bleed(self):
+        # Full-scale red/blue against full-scale green: each lane must blend on its own.
+        assert blend_hex("#FF00FF", "#00FF00", 0.5) == "#7F7F7F"
+        assert blend_hex("#FFFFFF", "#FFFFFF", 0.3) == "#FFFFFF"
+
+    def test_truncates_like_float_interpolation(self):
+        # int(a + (b - a) * t) per channel: 255 - 255 * 0.08 = 234.6 -> 234 (0xEA).
+        assert blend_hex("#FFFFFF", "#000000", 0.08) == "#EAEAEA"
+
 
 # ===========================================================================
 # blend_hex – clamping
@@ -101,6 +110,11 @@ class TestBlendHexInvalid:
         result = blend_hex("#GGHHII", "#000000", 0.5)
         assert result == "#GGHHII"  # exception caught, returns a
 
+    def test_non_hex_digits_rejected(self):
+        # int() would accept these, but they are not #RRGGBB colors.
+        assert blend_hex("#12_456", "#000000", 0.5) == "#12_456"
+        assert blend_hex("#+12345", "#000000", 0.5) == "#+12345"
+
     def test_both_invalid(self):
         result = blend_hex("bad", "worse", 0.5)
         assert result == "bad"
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import copy
+import os
+import pickle
 from pathlib import Path
 
 import pytest
 import yaml
 
+import thattan.core.levels as levels_module
 from thattan.core.levels import Level, LevelRepository
 
 
@@ -16,47 +20,11 @@ from thattan.core.levels import Level, LevelRepository
 
 @pytest.fixture()
 def levels_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
-    """Create a temporary levels directory and patch LevelRepository to use it."""
+    """Create a temporary levels directory and point LevelRepository (and its cache) at it."""
     d = tmp_path / "data" / "levels"
     d.mkdir(parents=True)
-
-    # Patch the base_dir resolution inside _load_levels
-    def _patched_load(self):
-        import re
-        base_dir = d
-        levels = {}
-
-        def _sort_key(p: Path) -> tuple:
-            m = re.match(r"^level(\d+)$", p.stem)
-            if m:
-                return (int(m.group(1)), p.stem)
-            return (10**9, p.stem)
-
-        for level_path in sorted(base_dir.glob("level*.yaml"), key=_sort_key):
-            key = level_path.stem
-            raw = yaml.safe_load(level_path.read_text(encoding="utf-8"))
-            if not raw or not isinstance(raw, dict):
-                raise ValueError(f"{level_path.name}: expected YAML with 'title' and 'content'")
-            title = raw.get("title")
-            content = raw.get("content")
-            if not title or not isinstance(title, str):
-                raise ValueError(f"{level_path.name}: missing or invalid 'title'")
-            if content is None:
-                raise ValueError(f"{level_path.name}: missing 'content'")
-            if isinstance(content, list):
-                tasks = [str(item).strip() for item in content if str(item).strip()]
-            else:
-                text = str(content).strip()
-                tasks = [line.strip() for line in text.splitlines() if line.strip()]
-            if not tasks:
-                raise ValueError(f"{level_path.name}: 'content' has no tasks")
-            levels[key] = Level(key=key, name=title.strip(), tasks=tasks)
-
-        if not levels:
-            raise ValueError("No level files (level*.yaml) found in data/levels")
-        return levels
-
-    monkeypatch.setattr(LevelRepository, "_load_levels", _patched_load)
+    monkeypatch.setattr(levels_module, "_LEVELS_DIR", d)
+    monkeypatch.setattr(levels_module, "_CACHE_PATH", tmp_path / "cache" / "levels-cache.json")
     return d
 
 
@@ -80,11 +48,24 @@ class TestLevelDataclass:
         with pytest.raises(AttributeError):
             lv.key = "other"  # type: ignore[misc]
 
+    def test_slots_no_instance_dict(self):
+        lv = Level(key="level0", name="Basics", tasks=["a"])
+        assert not hasattr(lv, "__dict__")
+
     def test_equality(self):
         a = Level(key="x", name="X", tasks=["t"])
         b = Level(key="x", name="X", tasks=["t"])
         assert a == b
 
+    @pytest.mark.parametrize(
+        "round_trip",
+        [copy.copy, copy.deepcopy, lambda lv: pickle.loads(pickle.dumps(lv))],
+        ids=["copy", "deepcopy", "pickle"],
+    )
+    def test_copy_and_pickle_round_trip(self, round_trip):
+        lv = Level(key="level0", name="Basics", tasks=["a", "b"])
+        assert round_trip(lv) == lv
+
 
 # ---------------------------------------------------------------------------
 # LevelRepository – happy paths
@@ -107,6 +88,18 @@ class TestLevelRepositoryHappy:
         keys = [lv.key for lv in repo.all()]
         assert keys == ["level0", "level1", "level2"]
 
+    def test_numeric_sort_with_non_numeric_last(self, levels_dir: Path):
+        for stem in ("levelx", "level10", "level2"):
+            _write_yaml(levels_dir / f"{stem}.yaml", {"title": stem, "content": ["a"]})
+        keys = [lv.key for lv in LevelRepository().all()]
+        assert keys == ["level2", "level10", "levelx"]
+
+    def test_all_returns_shared_tuple(self, levels_dir: Path):
+        _write_yaml(levels_dir / "level0.yaml", {"title": "T", "content": ["a"]})
+        repo = LevelRepository()
+        assert isinstance(repo.all(), tuple)
+        assert repo.all() is repo.all()
+
     def test_content_as_multiline_string(self, levels_dir: Path):
         _write_yaml(levels_dir / "level0.yaml", {"title": "T", "content": "line1\nline2\nline3"})
         repo = LevelRepository()
@@ -122,6 +115,12 @@ class TestLevelRepositoryHappy:
         repo = LevelRepository()
         assert repo.get("level0").name == "Padded"
 
+    def test_repeated_tasks_share_one_string(self, levels_dir: Path):
+        _write_yaml(levels_dir / "level0.yaml", {"title": "A", "content": ["அம்மா", "x"]})
+        _write_yaml(levels_dir / "level1.yaml", {"title": "B", "content": ["y", "அம்மா"]})
+        repo = LevelRepository()
+        assert repo.get("level0").tasks[0] is repo.get("level1").tasks[1]
+
 
 # ---------------------------------------------------------------------------
 # LevelRepository – error paths
@@ -172,3 +171,59 @@ class TestLevelRepositoryErrors:
         repo = LevelRepository()
         with pytest.raises(KeyError):
             repo.get("nonexistent")
+
+
+# ---------------------------------------------------------------------------
+# LevelRepository – on-disk cache
+# ---------------------------------------------------------------------------
+
+class TestLevelRepositoryCache:
+    def test_cache_written_after_load(self, levels_dir: Path):
+        _write_yaml(levels_dir / "level0.yaml", {"title": "T", "content": ["a"]})
+        LevelRepository()
+        assert levels_module._CACHE_PATH.exists()
+
+    def test_cache_hit_skips_yaml_parsing(self, levels_dir: Path, monkeypatch: pytest.MonkeyPatch):
+        _write_yaml(levels_dir / "level0.yaml", {"title": "T", "content": ["a", "b"]})
+        first = LevelRepository()
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("YAML should not be parsed on a cache hit")
+
+        monkeypatch.setattr(levels_module.yaml, "safe_load", _fail)
+        second = LevelRepository()
+        assert second.all() == first.all()
+
+    def test_cache_hit_after_levels_dir_moves(
+        self, levels_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Packaged builds unpack the levels to a new directory (with new mtimes) on every launch."""
+        _write_yaml(levels_dir / "level0.yaml", {"title": "T", "content": ["a", "b"]})
+        first = LevelRepository()
+
+        moved = tmp_path / "unpacked" / "levels"
+        moved.parent.mkdir()
+        levels_dir.rename(moved)
+        os.utime(moved / "level0.yaml", ns=(0, 0))
+        monkeypatch.setattr(levels_module, "_LEVELS_DIR", moved)
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("YAML should not be parsed on a cache hit")
+
+        monkeypatch.setattr(levels_module.yaml, "safe_load", _fail)
+        assert LevelRepository().all() == first.all()
+
+    def test_changed_file_invalidates_cache(self, levels_dir: Path):
+        path = levels_dir / "level0.yaml"
+        _write_yaml(path, {"title": "Old", "content": ["a"]})
+        LevelRepository()
+        _write_yaml(path, {"title": "New title", "content": ["a", "b"]})
+        repo = LevelRepository()
+        assert repo.get("level0").name == "New title"
+        assert repo.get("level0").tasks == ["a", "b"]
+
+    def test_corrupt_cache_is_ignored(self, levels_dir: Path):
+        _write_yaml(levels_dir / "level0.yaml", {"title": "T", "content": ["a"]})
+        levels_module._CACHE_PATH.parent.mkdir(parents=True)
+        levels_module._CACHE_PATH.write_text("{not json", encoding="utf-8")
+        assert LevelRepository().get("level0").tasks == ["a"]
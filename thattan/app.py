@@ -17,24 +17,24 @@ def configure_logging() -> None:
     )
 
 
-def load_application_font(app: QApplication) -> None:
+_ASSETS_DIR = Path(__file__).parent / "assets"
+_FONT_PATH = _ASSETS_DIR / "TAU-Marutham.ttf"
+_LOGO_DIR = _ASSETS_DIR / "logo"
+
+
+def load_application_font() -> None:
     """Load and set TAU-Marutham as the default font for the application"""
-    # Get the font file path
-    font_path = Path(__file__).parent / "assets" / "TAU-Marutham.ttf"
-    
-    if not font_path.exists():
-        logging.warning(f"Font file not found: {font_path}")
-        return
-    
-    # Load the font
-    font_id = QFontDatabase.addApplicationFont(str(font_path))
+    # Registered by path rather than from in-memory bytes: for data Qt enumerates every
+    # named instance of this variable font, which changes how the bold UI text renders.
+    # No exists() check first: Qt reports a missing or unreadable file as -1 as well.
+    font_id = QFontDatabase.addApplicationFont(str(_FONT_PATH))
     if font_id == -1:
-        logging.warning(f"Failed to load font: {font_path}")
+        logging.warning(f"Failed to load font: {_FONT_PATH}")
         return
 
     font_families = QFontDatabase.applicationFontFamilies(font_id)
     if not font_families:
-        logging.warning(f"Font loaded but no family name found: {font_path}")
+        logging.warning(f"Font loaded but no family name found: {_FONT_PATH}")
         return
 
     font_family = font_families[0]
@@ -58,8 +58,7 @@ def load_application_font(app: QApplication) -> None:
         pass
 
     app_font.setPointSize(11)  # default size; UI can override per-widget
-    app.setFont(app_font)
-    QGuiApplication.setFont(app_font)
+    # One call covers both Qt GUI and widgets; it runs before any window exists, so nothing is repolished.
     QApplication.setFont(app_font)
 
     logging.info(f"Loaded and set default font: {font_family}")
@@ -72,15 +71,14 @@ def run() -> None:
     app.setApplicationDisplayName("Thattan")
 
     # Load and set the Tamil font as default
-    load_application_font(app)
+    load_application_font()
 
     levels = LevelRepository()
     progress_store = ProgressStore()
 
     # Window icon (taskbar / title bar)
-    logo_dir = Path(__file__).parent / "assets" / "logo"
     for name in ("logo_256.png", "logo.svg"):
-        icon_path = logo_dir / name
+        icon_path = _LOGO_DIR / name
         if icon_path.exists():
             app.setWindowIcon(QIcon(str(icon_path)))
             break
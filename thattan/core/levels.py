@@ -1,14 +1,25 @@
 from __future__ import annotations
 
-import re
+import hashlib
+import json
+import logging
+import os
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 import yaml
 
+logger = logging.getLogger(__name__)
 
-@dataclass(frozen=True)
+_LEVELS_DIR = Path(__file__).resolve().parent.parent / "data" / "levels"
+# Parsed levels, reused while the level files are unchanged (see _load_levels).
+_CACHE_PATH = Path.home() / ".thattan" / "levels-cache.json"
+_CACHE_VERSION = 2
+
+
+@dataclass(frozen=True, slots=True)
 class Level:
     key: str
     name: str
@@ -16,49 +27,124 @@ class Level:
 
 
 class LevelRepository:
+    """All levels, loaded and validated up front.
+
+    Loading stays eager: the home screen needs every level's title and task count to
+    compute unlock state and progress, and a malformed level file should fail at startup
+    rather than when the learner opens it. The on-disk cache keeps this to one read.
+    """
+
     def __init__(self) -> None:
         self._levels = self._load_levels()
+        self._all = tuple(self._levels.values())
 
-    def all(self) -> List[Level]:
-        return list(self._levels.values())
+    def all(self) -> Tuple[Level, ...]:
+        return self._all
 
     def get(self, key: str) -> Level:
         return self._levels[key]
 
     def _load_levels(self) -> Dict[str, Level]:
-        base_dir = Path(__file__).resolve().parent.parent / "data" / "levels"
+        base_dir = _LEVELS_DIR
         if not base_dir.exists():
             raise FileNotFoundError(f"Levels directory not found: {base_dir}")
 
+        # The cache is keyed on file contents, not on paths or mtimes: packaged builds (PyInstaller
+        # onefile, AppImage) unpack the level files to a fresh directory with new mtimes on every
+        # launch. Hashing the raw bytes is far cheaper than parsing the YAML, which a hit skips.
+        with os.scandir(base_dir) as it:
+            entries = [e for e in it if e.name.startswith("level") and e.name.endswith(".yaml") and e.is_file()]
+        raw_by_path = {}
+        for entry in entries:
+            with open(entry.path, "rb") as f:
+                raw_by_path[entry.path] = f.read()
+        signature = sorted(
+            [e.name, len(raw_by_path[e.path]), hashlib.sha256(raw_by_path[e.path]).hexdigest()] for e in entries
+        )
+        cached = _read_cache(signature)
+        if cached is not None:
+            return cached
+
         levels: Dict[str, Level] = {}
+        # Levels repeat many of the same letters and words; share one str object per task text.
+        interned: Dict[str, str] = {}
 
-        def _sort_key(p: Path) -> tuple[int, str]:
-            m = re.match(r"^level(\d+)$", p.stem)
-            if m:
-                return (int(m.group(1)), p.stem)
-            return (10**9, p.stem)
+        # (number, key, path) triples built once and sorted as plain tuples; keys are unique,
+        # so paths are never compared. Non-numeric names sort after all numbered levels.
+        ordered = []
+        for entry in entries:
+            key = entry.name[: -len(".yaml")]
+            num = key[len("level") :]
+            ordered.append((int(num) if num.isdecimal() else 10**9, key, entry.path))
+        ordered.sort()
 
-        for level_path in sorted(base_dir.glob("level*.yaml"), key=_sort_key):
-            key = level_path.stem
-            raw = yaml.safe_load(level_path.read_text(encoding="utf-8"))
+        for _, key, path in ordered:
+            # PyYAML decodes the raw bytes itself (UTF-8 unless a BOM says otherwise).
+            raw = yaml.safe_load(raw_by_path[path])
             if not raw or not isinstance(raw, dict):
-                raise ValueError(f"{level_path.name}: expected YAML with 'title' and 'content'")
+                raise ValueError(f"{key}.yaml: expected YAML with 'title' and 'content'")
             title = raw.get("title")
             content = raw.get("content")
             if not title or not isinstance(title, str):
-                raise ValueError(f"{level_path.name}: missing or invalid 'title'")
+                raise ValueError(f"{key}.yaml: missing or invalid 'title'")
             if content is None:
-                raise ValueError(f"{level_path.name}: missing 'content'")
+                raise ValueError(f"{key}.yaml: missing 'content'")
             if isinstance(content, list):
-                tasks = [str(item).strip() for item in content if str(item).strip()]
+                tasks = [task for item in content if (task := str(item).strip())]
             else:
-                # allow content as multiline string
-                text = str(content).strip()
-                tasks = [line.strip() for line in text.splitlines() if line.strip()]
+                # allow content as multiline string (YAML has already normalised newlines to "\n")
+                tasks = [task for line in str(content).split("\n") if (task := line.strip())]
             if not tasks:
-                raise ValueError(f"{level_path.name}: 'content' has no tasks")
-            levels[key] = Level(key=key, name=title.strip(), tasks=tasks)
+                raise ValueError(f"{key}.yaml: 'content' has no tasks")
+            levels[key] = Level(key=key, name=title.strip(), tasks=[interned.setdefault(t, t) for t in tasks])
 
         if not levels:
             raise ValueError("No level files (level*.yaml) found in data/levels")
+        _write_cache(signature, levels)
         return levels
+
+
+def _read_cache(signature: list) -> Optional[Dict[str, Level]]:
+    """Return the cached levels if they were parsed from exactly these level files."""
+    try:
+        payload = json.loads(_CACHE_PATH.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (json.JSONDecodeError, OSError) as e:
+        logger.warning("Could not load level cache from %s: %s", _CACHE_PATH, e)
+        return None
+    if (
+        not isinstance(payload, dict)
+        or payload.get("version") != _CACHE_VERSION
+        or payload.get("signature") != signature
+    ):
+        return None
+    interned: Dict[str, str] = {}
+    try:
+        return {
+            key: Level(key=key, name=name, tasks=[interned.setdefault(t, t) for t in tasks])
+            for key, name, tasks in payload["levels"]
+        }
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _write_cache(signature: list, levels: Dict[str, Level]) -> None:
+    payload = {
+        "version": _CACHE_VERSION,
+        "signature": signature,
+        "levels": [[lv.key, lv.name, lv.tasks] for lv in levels.values()],
+    }
+    try:
+        _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a sibling temp file and rename so a crash never leaves a torn cache behind.
+        fd, tmp_name = tempfile.mkstemp(dir=_CACHE_PATH.parent, prefix=".levels-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(tmp_name, _CACHE_PATH)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError as e:
+        logger.warning("Could not save level cache to %s: %s", _CACHE_PATH, e)
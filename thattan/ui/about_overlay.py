@@ -9,7 +9,6 @@ from PySide6.QtCore import Qt, QSize, QEvent, Signal, QUrl
 from PySide6.QtGui import QColor, QDesktopServices, QIcon
 from PySide6.QtWidgets import (
     QFrame,
-    QGraphicsDropShadowEffect,
     QGridLayout,
     QHBoxLayout,
     QLabel,
@@ -19,10 +18,14 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from thattan.ui.shadows import CardShadow
+
 # Palette used by the overlay (avoids circular import from main_window)
 _PRIMARY = "#00838f"
 _PRIMARY_LIGHT = "#4fb3bf"
 
+_ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
+
 
 class AboutOverlay(QWidget):
     """In-window overlay for About — stays inside the main window and is clipped to it."""
@@ -63,11 +66,7 @@ class AboutOverlay(QWidget):
             }}
             """
         )
-        container_shadow = QGraphicsDropShadowEffect(container)
-        container_shadow.setBlurRadius(24)
-        container_shadow.setOffset(0, 8)
-        container_shadow.setColor(QColor(0, 80, 100, 25))
-        container.setGraphicsEffect(container_shadow)
+        CardShadow(container, radius=radius, blur=24, offset_y=8, color=QColor(0, 80, 100, 25))
         container_layout = QHBoxLayout(container)
         container_layout.setContentsMargins(0, 0, 0, 0)
         container_layout.setSpacing(0)
@@ -105,10 +104,9 @@ class AboutOverlay(QWidget):
         )
         icon_layout = QVBoxLayout(icon_box)
         icon_layout.setContentsMargins(0, 0, 0, 0)
-        _assets_dir = Path(__file__).resolve().parent.parent / "assets"
-        logo_path = _assets_dir / "logo" / "logo.svg"
+        logo_path = _ASSETS_DIR / "logo" / "logo.svg"
         if not logo_path.exists():
-            logo_path = _assets_dir / "logo" / "logo_256.png"
+            logo_path = _ASSETS_DIR / "logo" / "logo_256.png"
         icon_label = QLabel()
         if logo_path.exists():
             icon_label.setPixmap(QIcon(str(logo_path)).pixmap(QSize(80, 80)))
@@ -279,7 +277,7 @@ class AboutOverlay(QWidget):
         btn_row = QHBoxLayout()
         btn_row.setSpacing(10)
         report_issue_url = "https://github.com/khaleeljageer/thattan/issues/new"
-        bug_icon_path = _assets_dir / "icons" / "icon_bug.svg"
+        bug_icon_path = _ASSETS_DIR / "icons" / "icon_bug.svg"
         report_btn = QPushButton("Report Issue")
         if bug_icon_path.exists():
             report_btn.setIcon(QIcon(str(bug_icon_path)))
@@ -334,7 +332,7 @@ class AboutOverlay(QWidget):
 
     def _update_geometry(self) -> None:
         parent = self.parentWidget()
-        if parent is not None:
+        if parent is not None and self.geometry() != parent.rect():
             self.setGeometry(parent.rect())
 
     def resizeEvent(self, event) -> None:
@@ -342,9 +340,10 @@ class AboutOverlay(QWidget):
         self._update_geometry()
 
     def eventFilter(self, obj: QWidget, event: QEvent) -> bool:
-        if obj is self.parentWidget() and event.type() == QEvent.Type.Resize:
+        # Installed on the parent only while shown, to follow its size; never consumes events.
+        if event.type() == QEvent.Type.Resize and obj is self.parentWidget():
             self._update_geometry()
-        return super().eventFilter(obj, event)
+        return False
 
     def showEvent(self, event) -> None:
         super().showEvent(event)
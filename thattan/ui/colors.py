@@ -1,5 +1,8 @@
 """Theme colors and color utilities for the UI."""
 
+import re
+from functools import lru_cache
+
 
 class HomeColors:
     """Light theme palette (ported from `test.py`)."""
@@ -32,19 +35,24 @@ class HomeColors:
     PROGRESS_LABEL_MUTED = "#648282"
 
 
+_HEX_COLOR = re.compile(r"#[0-9A-Fa-f]{6}")
+
+
+@lru_cache(maxsize=256)
 def blend_hex(a: str, b: str, t: float) -> str:
     """Blend two #RRGGBB colors. t=0 -> a, t=1 -> b."""
     try:
         a = a.strip()
         b = b.strip()
-        if not (a.startswith("#") and b.startswith("#") and len(a) == 7 and len(b) == 7):
+        if not (_HEX_COLOR.fullmatch(a) and _HEX_COLOR.fullmatch(b)):
             return a
         t = max(0.0, min(1.0, float(t)))
-        ar, ag, ab = int(a[1:3], 16), int(a[3:5], 16), int(a[5:7], 16)
-        br, bg, bb = int(b[1:3], 16), int(b[3:5], 16), int(b[5:7], 16)
-        r = int(ar + (br - ar) * t)
-        g = int(ag + (bg - ag) * t)
-        bl = int(ab + (bb - ab) * t)
-        return f"#{r:02X}{g:02X}{bl:02X}"
+        av = int(a[1:], 16)
+        bv = int(b[1:], 16)
+        ar, ag, ab = av >> 16, (av >> 8) & 0xFF, av & 0xFF
+        r = int(ar + ((bv >> 16) - ar) * t)
+        g = int(ag + (((bv >> 8) & 0xFF) - ag) * t)
+        bl = int(ab + ((bv & 0xFF) - ab) * t)
+        return "#%06X" % (r << 16 | g << 8 | bl)
     except Exception:
         return a
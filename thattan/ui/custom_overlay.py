@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Optional
 
 from PySide6.QtCore import Qt, QSize, QEvent, Signal
-from PySide6.QtGui import QColor, QIcon
+from PySide6.QtGui import QIcon, QPixmap
 from PySide6.QtWidgets import (
     QFrame,
-    QGraphicsDropShadowEffect,
     QGridLayout,
     QHBoxLayout,
     QLabel,
@@ -22,32 +22,108 @@ from PySide6.QtWidgets import (
 _PRIMARY = "#00838f"
 _PRIMARY_LIGHT = "#4fb3bf"
 
-
-def _themed_card_container(radius: int = 20, object_name: str = "overlayContainer") -> QFrame:
+_ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
+_RESTART_ICON_PATH = _ASSETS_DIR / "icons" / "icon_restart.svg"
+_RESTART_ICON_EXISTS = _RESTART_ICON_PATH.exists()
+
+
+# One sheet per overlay root: children are matched by object name / "role" property, so Qt
+# parses these rules once per overlay instead of once per styled child widget.
+_OVERLAY_QSS = f"""
+    QWidget#overlayBackdrop {{
+        background: rgba(0, 0, 0, 0.2);
+    }}
+    QFrame#overlayCard {{
+        background: #ffffff;
+        border: 1px solid rgba(0, 131, 143, 0.2);
+        border-radius: 20px;
+    }}
+    QFrame#overlayIconBox {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 #e0f7fa, stop:1 #b2ebf2);
+        border-radius: 12px;
+    }}
+    QLabel#overlayGlyph {{
+        color: {_PRIMARY};
+        font-size: 24px;
+        font-weight: 900;
+    }}
+    QLabel#overlayTitle {{
+        color: {_PRIMARY};
+        font-size: 18px;
+        font-weight: 800;
+    }}
+    QLabel#overlayMessage {{
+        color: #1a3a3a;
+        font-size: 14px;
+        font-weight: 500;
+    }}
+    QPushButton[role="secondary"] {{
+        background: #fafafa;
+        color: #1a3a3a;
+        padding: 10px 16px;
+        border: 1px solid #e0e0e0;
+        border-radius: 12px;
+        font-weight: 600;
+        font-size: 13px;
+    }}
+    QPushButton[role="secondary"]:hover {{
+        background: #f0f0f0;
+        border-color: #00838f;
+        color: #00838f;
+    }}
+    QPushButton[role="primary"] {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 {_PRIMARY_LIGHT}, stop:1 {_PRIMARY});
+        color: white;
+        padding: 10px 16px;
+        border: none;
+        border-radius: 12px;
+        font-weight: 600;
+        font-size: 13px;
+    }}
+    QPushButton[role="primary"]:hover {{ background: {_PRIMARY}; }}
+"""
+
+
+@lru_cache(maxsize=16)
+def _pixmap(path: str, width: int, height: int) -> QPixmap:
+    """Rasterize an icon once per (path, size); QPixmap is implicitly shared, so reuse is cheap."""
+    return QIcon(path).pixmap(QSize(width, height))
+
+
+def _themed_card_container() -> QFrame:
     container = QFrame()
-    container.setObjectName(object_name)
+    container.setObjectName("overlayCard")
     container.setMinimumWidth(400)
     container.setMaximumWidth(480)
-    container.setStyleSheet(
-        f"""
-        QFrame#{object_name} {{
-            background: #ffffff;
-            border: 1px solid rgba(0, 131, 143, 0.12);
-            border-radius: {radius}px;
-        }}
-        """
-    )
-    shadow = QGraphicsDropShadowEffect(container)
-    shadow.setBlurRadius(20)
-    shadow.setOffset(0, 6)
-    shadow.setColor(QColor(0, 80, 100, 25))
-    container.setGraphicsEffect(shadow)
+    # No graphics-effect shadow: the card sits on a dimmed backdrop, and a blur effect
+    # would be re-rendered in software on every repaint and resize of the overlay.
     return container
 
 
+def _icon_box(icon_label: QLabel) -> QFrame:
+    icon_box = QFrame()
+    icon_box.setObjectName("overlayIconBox")
+    icon_box.setFixedSize(44, 44)
+    icon_layout = QVBoxLayout(icon_box)
+    icon_layout.setContentsMargins(0, 0, 0, 0)
+    icon_label.setAlignment(Qt.AlignCenter)
+    icon_layout.addWidget(icon_label)
+    return icon_box
+
+
+def _overlay_button(text: str, role: str) -> QPushButton:
+    button = QPushButton(text)
+    button.setProperty("role", role)
+    button.setCursor(Qt.CursorShape.PointingHandCursor)
+    button.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+    return button
+
+
 def _overlay_background(parent: QWidget, on_click: Callable[[], None]) -> QWidget:
     overlay_bg = QWidget(parent)
-    overlay_bg.setStyleSheet("background: rgba(0, 0, 0, 0.2);")
+    overlay_bg.setObjectName("overlayBackdrop")
     overlay_bg.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
     overlay_bg.setCursor(Qt.CursorShape.ArrowCursor)
     overlay_bg.setMinimumSize(1, 1)
@@ -55,41 +131,6 @@ def _overlay_background(parent: QWidget, on_click: Callable[[], None]) -> QWidge
     return overlay_bg
 
 
-def _secondary_button_style() -> str:
-    return """
-        QPushButton {
-            background: #fafafa;
-            color: #1a3a3a;
-            padding: 10px 16px;
-            border: 1px solid #e0e0e0;
-            border-radius: 12px;
-            font-weight: 600;
-            font-size: 13px;
-        }
-        QPushButton:hover {
-            background: #f0f0f0;
-            border-color: #00838f;
-            color: #00838f;
-        }
-    """
-
-
-def _primary_button_style() -> str:
-    return f"""
-        QPushButton {{
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                stop:0 {_PRIMARY_LIGHT}, stop:1 {_PRIMARY});
-            color: white;
-            padding: 10px 16px;
-            border: none;
-            border-radius: 12px;
-            font-weight: 600;
-            font-size: 13px;
-        }}
-        QPushButton:hover {{ background: {_PRIMARY}; }}
-    """
-
-
 class ResetConfirmOverlay(QWidget):
     """In-window overlay to confirm reset progress."""
 
@@ -97,6 +138,7 @@ class ResetConfirmOverlay(QWidget):
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
+        self.setStyleSheet(_OVERLAY_QSS)
         main_layout = QGridLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(0)
@@ -106,63 +148,40 @@ class ResetConfirmOverlay(QWidget):
         overlay_bg = _overlay_background(self, lambda: (self.hide(), self.closed.emit(False)))
         main_layout.addWidget(overlay_bg, 0, 0)
 
-        container = _themed_card_container(object_name="resetContainer")
+        container = _themed_card_container()
         content = QVBoxLayout(container)
         content.setContentsMargins(28, 24, 28, 24)
         content.setSpacing(18)
 
         header = QHBoxLayout()
         header.setSpacing(12)
-        _assets_dir = Path(__file__).resolve().parent.parent / "assets"
-        icon_box = QFrame()
-        icon_box.setFixedSize(44, 44)
-        icon_box.setStyleSheet(
-            """
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #e0f7fa, stop:1 #b2ebf2);
-                border-radius: 12px;
-            }
-            """
-        )
-        icon_layout = QVBoxLayout(icon_box)
-        icon_layout.setContentsMargins(0, 0, 0, 0)
-        restart_icon_path = _assets_dir / "icons" / "icon_restart.svg"
         icon_label = QLabel()
-        if restart_icon_path.exists():
-            icon_label.setPixmap(QIcon(str(restart_icon_path)).pixmap(QSize(28, 28)))
+        if _RESTART_ICON_EXISTS:
+            icon_label.setPixmap(_pixmap(str(_RESTART_ICON_PATH), 28, 28))
         else:
             icon_label.setText("↻")
-            icon_label.setStyleSheet(f"color: {_PRIMARY}; font-size: 22px; font-weight: 900;")
-        icon_label.setAlignment(Qt.AlignCenter)
-        icon_layout.addWidget(icon_label)
-        header.addWidget(icon_box, 0)
+            icon_label.setObjectName("overlayGlyph")
+        header.addWidget(_icon_box(icon_label), 0)
 
         title = QLabel("மீட்டமை")
-        title.setStyleSheet(f"color: {_PRIMARY}; font-size: 18px; font-weight: 800;")
+        title.setObjectName("overlayTitle")
         header.addWidget(title, 0)
         header.addStretch(1)
         content.addLayout(header)
 
         msg = QLabel("அனைத்து முன்னேற்றத்தையும் மீட்டமைக்க வேண்டுமா?")
-        msg.setStyleSheet("color: #1a3a3a; font-size: 14px; font-weight: 500;")
+        msg.setObjectName("overlayMessage")
         msg.setWordWrap(True)
         content.addWidget(msg, 0)
 
         btn_row = QHBoxLayout()
         btn_row.setSpacing(10)
 
-        cancel_btn = QPushButton("மூடு")
-        cancel_btn.setStyleSheet(_secondary_button_style())
-        cancel_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        cancel_btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        cancel_btn = _overlay_button("மூடு", "secondary")
         cancel_btn.clicked.connect(lambda: (self.hide(), self.closed.emit(False)))
         btn_row.addWidget(cancel_btn, 1)
 
-        confirm_btn = QPushButton("மீட்டமை")
-        confirm_btn.setStyleSheet(_primary_button_style())
-        confirm_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        confirm_btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        confirm_btn = _overlay_button("மீட்டமை", "primary")
         confirm_btn.clicked.connect(lambda: (self.hide(), self.closed.emit(True)))
         btn_row.addWidget(confirm_btn, 1)
 
@@ -173,7 +192,7 @@ class ResetConfirmOverlay(QWidget):
     def _add_overlay_geometry_behavior(self) -> None:
         def _update_geometry() -> None:
             parent = self.parentWidget()
-            if parent is not None:
+            if parent is not None and self.geometry() != parent.rect():
                 self.setGeometry(parent.rect())
 
         self._update_geometry = _update_geometry
@@ -183,9 +202,10 @@ class ResetConfirmOverlay(QWidget):
         self._update_geometry()
 
     def eventFilter(self, obj: QWidget, event: QEvent) -> bool:
-        if obj is self.parentWidget() and event.type() == QEvent.Type.Resize:
+        # Installed on the parent only while shown, to follow its size; never consumes events.
+        if event.type() == QEvent.Type.Resize and obj is self.parentWidget():
             self._update_geometry()
-        return super().eventFilter(obj, event)
+        return False
 
     def showEvent(self, event) -> None:
         super().showEvent(event)
@@ -208,6 +228,7 @@ class LevelCompletedOverlay(QWidget):
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
+        self.setStyleSheet(_OVERLAY_QSS)
         main_layout = QGridLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(0)
@@ -217,47 +238,29 @@ class LevelCompletedOverlay(QWidget):
         overlay_bg = _overlay_background(self, lambda: (self.hide(), self.closed.emit()))
         main_layout.addWidget(overlay_bg, 0, 0)
 
-        container = _themed_card_container(object_name="levelCompletedContainer")
+        container = _themed_card_container()
         content = QVBoxLayout(container)
         content.setContentsMargins(28, 24, 28, 24)
         content.setSpacing(18)
 
         header = QHBoxLayout()
         header.setSpacing(12)
-        icon_box = QFrame()
-        icon_box.setFixedSize(44, 44)
-        icon_box.setStyleSheet(
-            """
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 #e0f7fa, stop:1 #b2ebf2);
-                border-radius: 12px;
-            }
-            """
-        )
-        icon_layout = QVBoxLayout(icon_box)
-        icon_layout.setContentsMargins(0, 0, 0, 0)
         icon_label = QLabel("✓")
-        icon_label.setStyleSheet(f"color: {_PRIMARY}; font-size: 24px; font-weight: 900;")
-        icon_label.setAlignment(Qt.AlignCenter)
-        icon_layout.addWidget(icon_label)
-        header.addWidget(icon_box, 0)
+        icon_label.setObjectName("overlayGlyph")
+        header.addWidget(_icon_box(icon_label), 0)
 
         title = QLabel("நிலை முடிந்தது")
-        title.setStyleSheet(f"color: {_PRIMARY}; font-size: 18px; font-weight: 800;")
+        title.setObjectName("overlayTitle")
         header.addWidget(title, 0)
         header.addStretch(1)
         content.addLayout(header)
 
         msg = QLabel("இந்த நிலையை நீங்கள் முடித்துவிட்டீர்கள்!")
-        msg.setStyleSheet("color: #1a3a3a; font-size: 14px; font-weight: 500;")
+        msg.setObjectName("overlayMessage")
         msg.setWordWrap(True)
         content.addWidget(msg, 0)
 
-        ok_btn = QPushButton("சரி")
-        ok_btn.setStyleSheet(_primary_button_style())
-        ok_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        ok_btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        ok_btn = _overlay_button("சரி", "primary")
         ok_btn.clicked.connect(lambda: (self.hide(), self.closed.emit()))
         content.addWidget(ok_btn, 0)
 
@@ -267,7 +270,7 @@ class LevelCompletedOverlay(QWidget):
     def _add_overlay_geometry_behavior(self) -> None:
         def _update_geometry() -> None:
             parent = self.parentWidget()
-            if parent is not None:
+            if parent is not None and self.geometry() != parent.rect():
                 self.setGeometry(parent.rect())
 
         self._update_geometry = _update_geometry
@@ -277,9 +280,10 @@ class LevelCompletedOverlay(QWidget):
         self._update_geometry()
 
     def eventFilter(self, obj: QWidget, event: QEvent) -> bool:
-        if obj is self.parentWidget() and event.type() == QEvent.Type.Resize:
+        # Installed on the parent only while shown, to follow its size; never consumes events.
+        if event.type() == QEvent.Type.Resize and obj is self.parentWidget():
             self._update_geometry()
-        return super().eventFilter(obj, event)
+        return False
 
     def showEvent(self, event) -> None:
         super().showEvent(event)
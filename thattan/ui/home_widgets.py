@@ -2,22 +2,32 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Optional
 
-from PySide6.QtCore import Qt, QPoint, QSize
+from PySide6.QtCore import QEvent, Qt, QPoint, QPointF, QRect, QSize, QTimer
 from PySide6.QtGui import (
+    QBrush,
     QColor,
+    QCursor,
     QFont,
+    QFontMetrics,
+    QFontMetricsF,
+    QGradient,
     QIcon,
+    QImage,
     QLinearGradient,
     QPainter,
-    QPen,
+    QPixmap,
+    QPixmapCache,
     QRadialGradient,
+    QStaticText,
+    QTransform,
 )
 from PySide6.QtWidgets import (
     QFrame,
-    QGraphicsDropShadowEffect,
     QHBoxLayout,
     QLabel,
     QPushButton,
@@ -27,6 +37,49 @@ from PySide6.QtWidgets import (
 )
 
 from thattan.ui.colors import HomeColors
+from thattan.ui.shadows import CardShadow
+
+_ICONS_DIR = Path(__file__).resolve().parent.parent / "assets" / "icons"
+
+
+class _HC:
+    """QColor counterparts of the palette for painter code; stylesheets keep the strings."""
+
+    BG_TOP = QColor(HomeColors.BG_TOP)
+    BG_MIDDLE = QColor(HomeColors.BG_MIDDLE)
+    BG_BOTTOM = QColor(HomeColors.BG_BOTTOM)
+    PRIMARY_DARK = QColor(HomeColors.PRIMARY_DARK)
+    WHITE = QColor(255, 255, 255)
+    WHITE_0 = QColor(255, 255, 255, 0)
+    WHITE_40 = QColor(255, 255, 255, 40)
+    WHITE_55 = QColor(255, 255, 255, 55)
+    WHITE_60 = QColor(255, 255, 255, 60)
+    WHITE_70 = QColor(255, 255, 255, 70)
+    TRACK_DEFAULT = QColor(0, 0, 0, 25)
+
+
+def _canvas(width: int, height: int, dpr: float) -> QImage:
+    """Transparent offscreen image for the render caches below.
+
+    ARGB32_Premultiplied is the format Qt's raster engine paints and blits natively, so
+    drawing into it and blitting the resulting pixmap skips per-pixel format conversion.
+    """
+    image = QImage(QSize(width, height) * dpr, QImage.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(dpr)
+    image.fill(Qt.transparent)
+    return image
+
+
+@lru_cache(maxsize=None)
+def _cursor(shape: Qt.CursorShape) -> QCursor:
+    """Shared QCursor per shape (built lazily: QCursor needs a QGuiApplication)."""
+    return QCursor(shape)
+
+
+@lru_cache(maxsize=64)
+def _qcolor(name: str) -> QColor:
+    """Parsed QColor for a color string passed in at runtime (e.g. progress-bar stops)."""
+    return QColor(name)
 
 
 class AspectRatioWidget(QWidget):
@@ -70,61 +123,172 @@ class AspectRatioWidget(QWidget):
         super().resizeEvent(event)
 
 
+_DECORATION_LETTERS = (('அ', 0.08, 0.22), ('இ', 0.86, 0.35), ('உ', 0.14, 0.78), ('எ', 0.78, 0.83), ('ஒ', 0.48, 0.52))
+# Soft bubble glows: (x ratio, y ratio, radius, center color); two large, then four small.
+_DECORATION_GLOWS = (
+    (0.85, 0.15, 220, _HC.WHITE_70),
+    (0.12, 0.82, 170, _HC.WHITE_55),
+    (0.2, 0.3, 90, _HC.WHITE_40),
+    (0.7, 0.62, 70, _HC.WHITE_40),
+    (0.9, 0.78, 80, _HC.WHITE_40),
+    (0.15, 0.62, 60, _HC.WHITE_40),
+)
+
+
 class CoolBackground(QWidget):
     """Gradient background with subtle decorative shapes (light theme)."""
 
+    _letter_cache: dict[tuple[str, float], tuple[int, list[QPixmap]]] = {}
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        # The gradient covers every pixel, so Qt need not clear the area before paintEvent
+        # nor fill it with the palette's system background.
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
+        # Everything drawn here depends only on the widget size, so it is rendered once
+        # per size into a pixmap and each repaint is a single blit. The last few renderings
+        # are kept by (width, height, dpr): toggling maximize/restore reuses them.
+        self._cache: Optional[QPixmap] = None
+        self._renders: OrderedDict[tuple[int, int, float], QPixmap] = OrderedDict()
+        # Size-dependent geometry, rebuilt in resizeEvent: (brush, center, radius) per glow
+        # and the top-left anchor (before ascent) of each decorative letter.
+        self._glows: list[tuple[QRadialGradient, QPoint, int]] = []
+        self._letter_pos: list[tuple[int, int]] = []
+        self._update_geometry()
+        # While the window is being dragged, the last rendering is stretched to fit instead of
+        # re-rendering at every intermediate size; the exact size is rendered once it settles.
+        self._resize_settle = QTimer(self)
+        self._resize_settle.setSingleShot(True)
+        self._resize_settle.setInterval(self._RESIZE_SETTLE_MS)
+        self._resize_settle.timeout.connect(self._on_resize_settled)
+
+    _RESIZE_SETTLE_MS = 150
+    _MAX_RENDERS = 2
+
+    def resizeEvent(self, event) -> None:
+        self._update_geometry()
+        if self._cache is not None:
+            self._resize_settle.start()
+        super().resizeEvent(event)
+
+    def _on_resize_settled(self) -> None:
+        self.update()
+
+    def _update_geometry(self) -> None:
+        w, h = self.width(), self.height()
+        self._glows = []
+        for x_ratio, y_ratio, radius, color in _DECORATION_GLOWS:
+            radial = QRadialGradient(w * x_ratio, h * y_ratio, radius)
+            radial.setColorAt(0, color)
+            radial.setColorAt(1, _HC.WHITE_0)
+            self._glows.append((radial, QPoint(int(w * x_ratio), int(h * y_ratio)), radius))
+        self._letter_pos = [(int(w * x), int(h * y)) for _, x, y in _DECORATION_LETTERS]
 
     def paintEvent(self, event) -> None:
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), dpr)
+        rendered = self._renders.get(key)
+        if rendered is not None:
+            self._resize_settle.stop()
+            self._renders.move_to_end(key)
+            self._cache = rendered
+        elif self._cache is None or self._cache.devicePixelRatioF() != dpr or not self._resize_settle.isActive():
+            self._resize_settle.stop()
+            self._cache = self._renders[key] = self._render(dpr)
+            if len(self._renders) > self._MAX_RENDERS:
+                self._renders.popitem(last=False)
         painter = QPainter(self)
+        if self._resize_settle.isActive():
+            painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
+            painter.drawPixmap(self.rect(), self._cache)
+        else:
+            painter.drawPixmap(0, 0, self._cache)
+
+    def _render(self, dpr: float) -> QPixmap:
+        image = _canvas(self.width(), self.height(), dpr)
+        painter = QPainter(image)
+        self._paint_decoration(painter)
+        painter.end()
+        return QPixmap.fromImage(image)
+
+    def _paint_decoration(self, painter: QPainter) -> None:
         painter.setRenderHint(QPainter.Antialiasing, True)
 
         gradient = QLinearGradient(0, 0, self.width(), self.height())
-        gradient.setColorAt(0.0, QColor(HomeColors.BG_TOP))
-        gradient.setColorAt(0.5, QColor(HomeColors.BG_MIDDLE))
-        gradient.setColorAt(1.0, QColor(HomeColors.BG_BOTTOM))
+        gradient.setColorAt(0.0, _HC.BG_TOP)
+        gradient.setColorAt(0.5, _HC.BG_MIDDLE)
+        gradient.setColorAt(1.0, _HC.BG_BOTTOM)
         painter.fillRect(self.rect(), gradient)
 
         painter.setPen(Qt.NoPen)
 
         # Soft bubble glows
-        radial1 = QRadialGradient(self.width() * 0.85, self.height() * 0.15, 220)
-        radial1.setColorAt(0, QColor(255, 255, 255, 70))
-        radial1.setColorAt(1, QColor(255, 255, 255, 0))
-        painter.setBrush(radial1)
-        painter.drawEllipse(QPoint(int(self.width() * 0.85), int(self.height() * 0.15)), 220, 220)
-
-        radial2 = QRadialGradient(self.width() * 0.12, self.height() * 0.82, 170)
-        radial2.setColorAt(0, QColor(255, 255, 255, 55))
-        radial2.setColorAt(1, QColor(255, 255, 255, 0))
-        painter.setBrush(radial2)
-        painter.drawEllipse(QPoint(int(self.width() * 0.12), int(self.height() * 0.82)), 170, 170)
-
-        small_circles = [(0.2, 0.3, 90), (0.7, 0.62, 70), (0.9, 0.78, 80), (0.15, 0.62, 60)]
-        for x_ratio, y_ratio, radius in small_circles:
-            radial = QRadialGradient(self.width() * x_ratio, self.height() * y_ratio, radius)
-            radial.setColorAt(0, QColor(255, 255, 255, 40))
-            radial.setColorAt(1, QColor(255, 255, 255, 0))
+        for radial, center, radius in self._glows:
             painter.setBrush(radial)
-            painter.drawEllipse(QPoint(int(self.width() * x_ratio), int(self.height() * y_ratio)), radius, radius)
+            painter.drawEllipse(center, radius, radius)
 
         # Very subtle Tamil letters
         painter.setOpacity(0.06)
         font = painter.font()
         font.setPointSize(90)
         font.setBold(True)
-        painter.setFont(font)
-        painter.setPen(QColor(HomeColors.PRIMARY_DARK))
-        letters = [('அ', 0.08, 0.22), ('இ', 0.86, 0.35), ('உ', 0.14, 0.78), ('எ', 0.78, 0.83), ('ஒ', 0.48, 0.52)]
-        for letter, x, y in letters:
-            painter.drawText(int(self.width() * x), int(self.height() * y), letter)
+        ascent, letters = self._letter_pixmaps(font, painter.device().devicePixelRatioF())
+        for pixmap, (x, y) in zip(letters, self._letter_pos):
+            # Positions are baselines (as drawText() used); the pixmaps start at the ascent line.
+            painter.drawPixmap(x, y - ascent, pixmap)
+
+    @classmethod
+    def _letter_pixmaps(cls, font: QFont, dpr: float) -> tuple[int, list[QPixmap]]:
+        """Rasterise the decorative letters once per font and pixel ratio, shared by all instances.
+
+        At 90pt the glyphs are too large for Qt's glyph cache, so drawing them as text would
+        re-rasterise the outlines on every background render.
+        """
+        key = (font.key(), dpr)
+        cached = cls._letter_cache.get(key)
+        if cached is None:
+            letters = []
+            for letter, _, _ in _DECORATION_LETTERS:
+                static_text = QStaticText(letter)
+                static_text.prepare(QTransform(), font)
+                size = static_text.size().toSize()
+                image = _canvas(size.width(), size.height(), dpr)
+                painter = QPainter(image)
+                painter.setFont(font)
+                painter.setPen(_HC.PRIMARY_DARK)
+                painter.drawStaticText(0, 0, static_text)
+                painter.end()
+                letters.append(QPixmap.fromImage(image))
+            cached = cls._letter_cache[key] = (QFontMetrics(font).ascent(), letters)
+        return cached
+
+
+def _track_pixmap(width: int, height: int, color: Optional[str], dpr: float) -> QPixmap:
+    """Rounded progress-bar track, cached in QPixmapCache per size, color and pixel ratio."""
+    key = f"thattan-bar-track:{width}x{height}:{color}:{dpr}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        image = _canvas(width, height, dpr)
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setPen(Qt.NoPen)
+        # None = default dark translucent track.
+        painter.setBrush(_qcolor(color) if color else _HC.TRACK_DEFAULT)
+        radius = min(8, height // 2)
+        painter.drawRoundedRect(0, 0, width, height, radius, radius)
+        painter.end()
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
 
 
 class HomeProgressBar(QWidget):
     """Rounded gradient progress bar (ported from `test.py`)."""
 
+    _HIGHLIGHT_BRUSH = QBrush(_HC.WHITE_60)
+
     def __init__(
         self,
         parent: Optional[QWidget] = None,
@@ -140,58 +304,136 @@ class HomeProgressBar(QWidget):
         self._color_end = HomeColors.PRIMARY
         self._track_color = track_color  # None = default dark translucent
         self._show_percentage = show_percentage
+        # Qt repaints the bar for reasons unrelated to its value (parent restyles, hover on the
+        # row card); the last rendering is kept and reused while nothing it depends on changed.
+        self._cache_key: Optional[tuple] = None
+        self._cache_pix: Optional[QPixmap] = None
+        self._fill_brush_key: Optional[tuple] = None
+        self._fill_brush_cache: Optional[QBrush] = None
         self.setFixedHeight(height)
         self.setMinimumWidth(100)
+        # Percentage label: font built once, text laid out only when the percentage changes.
+        self._pct_font = self._make_pct_font()
+        self._pct_static = QStaticText()
+        self._pct_static.setTextFormat(Qt.PlainText)
+        self._last_pct: Optional[int] = None
+
+    def _make_pct_font(self) -> QFont:
+        font = QFont(self.font())
+        font.setPointSize(max(9, self.height() - 4))
+        font.setWeight(QFont.Weight.DemiBold)
+        return font
 
     def set_progress(self, value: int, max_value: int, color_start: Optional[str] = None, color_end: Optional[str] = None) -> None:
-        self._value = int(value)
-        self._max_value = int(max_value) if int(max_value) > 0 else 1
-        if color_start:
-            self._color_start = color_start
-        if color_end:
-            self._color_end = color_end
+        state = (
+            int(value),
+            int(max_value) if int(max_value) > 0 else 1,
+            color_start or self._color_start,
+            color_end or self._color_end,
+        )
+        if state == (self._value, self._max_value, self._color_start, self._color_end):
+            return
+        self._value, self._max_value, self._color_start, self._color_end = state
+        self._cache_key = None
         self.update()
 
+    def changeEvent(self, event) -> None:
+        if event.type() == QEvent.Type.FontChange:
+            self._pct_font = self._make_pct_font()
+            self._last_pct = None
+            self._cache_key = None
+        super().changeEvent(event)
+
     def paintEvent(self, event) -> None:
+        dpr = self.devicePixelRatioF()
+        key = (
+            self._value,
+            self._max_value,
+            self.width(),
+            self.height(),
+            dpr,
+            self._color_start,
+            self._color_end,
+            self._track_color,
+            self._show_percentage,
+        )
+        if key != self._cache_key:
+            self._cache_pix = self._render(dpr)
+            self._cache_key = key
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._cache_pix)
+
+    def _render(self, dpr: float) -> QPixmap:
+        image = _canvas(self.width(), self.height(), dpr)
+        painter = QPainter(image)
+        self._paint_bar(painter)
+        painter.end()
+        return QPixmap.fromImage(image)
+
+    def _fill_brush(self, progress_width: int) -> QBrush:
+        """Gradient brush for the fill, rebuilt only when its colors or extent change."""
+        key = (self._color_start, self._color_end, progress_width)
+        if key != self._fill_brush_key:
+            gradient = QLinearGradient(0, 0, progress_width, 0)
+            gradient.setColorAt(0, _qcolor(self._color_start))
+            gradient.setColorAt(1, _qcolor(self._color_end))
+            self._fill_brush_cache = QBrush(gradient)
+            self._fill_brush_key = key
+        return self._fill_brush_cache
+
+    def _paint_bar(self, painter: QPainter) -> None:
+        # Antialiasing stays on: the bar is rendered into the cached pixmap only when its value
+        # or size changes, and a 10px-high rounded bar looks visibly jagged without it.
         painter.setRenderHint(QPainter.Antialiasing, True)
         painter.setRenderHint(QPainter.TextAntialiasing, True)
-        painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
 
-        # Track
-        if self._track_color:
-            painter.setBrush(QColor(self._track_color))
-        else:
-            painter.setBrush(QColor(0, 0, 0, 25))
+        # Track: shared by every bar of the same size and color, so its antialiased outline
+        # is rasterised once rather than once per bar.
+        dpr = painter.device().devicePixelRatioF()
+        painter.drawPixmap(0, 0, _track_pixmap(self.width(), self.height(), self._track_color, dpr))
         painter.setPen(Qt.NoPen)
         radius = min(8, self.height() // 2)
-        painter.drawRoundedRect(0, 0, self.width(), self.height(), radius, radius)
 
         progress_width = int((self._value / self._max_value) * self.width()) if self._max_value else 0
         if progress_width > 0:
-            gradient = QLinearGradient(0, 0, progress_width, 0)
-            gradient.setColorAt(0, QColor(self._color_start))
-            gradient.setColorAt(1, QColor(self._color_end))
-            painter.setBrush(gradient)
+            painter.setBrush(self._fill_brush(progress_width))
             painter.drawRoundedRect(0, 0, progress_width, self.height(), radius, radius)
 
             if not self._track_color:
-                painter.setBrush(QColor(255, 255, 255, 60))
+                painter.setBrush(self._HIGHLIGHT_BRUSH)
                 painter.drawRoundedRect(0, 0, progress_width, max(2, self.height() // 2), radius, radius)
 
             # Percentage on fill (e.g. "25%")
             if self._show_percentage and self._max_value > 0:
                 pct = round((self._value / self._max_value) * 100)
-                painter.setPen(Qt.NoPen)
-                painter.setBrush(Qt.NoBrush)
-                font = painter.font()
-                font.setPointSize(max(9, self.height() - 4))
-                font.setWeight(QFont.Weight.DemiBold)
-                painter.setFont(font)
-                painter.setPen(QColor("#ffffff"))
-                text = f"{pct}%"
-                text_rect = painter.boundingRect(0, 0, progress_width, self.height(), Qt.AlignCenter, text)
-                painter.drawText(text_rect, Qt.AlignCenter, text)
+                if pct != self._last_pct:
+                    self._pct_static.setText(f"{pct}%")
+                    self._pct_static.prepare(QTransform(), self._pct_font)
+                    self._last_pct = pct
+                size = self._pct_static.size()
+                painter.setFont(self._pct_font)
+                painter.setPen(_HC.WHITE)
+                painter.drawStaticText(
+                    QPointF((progress_width - size.width()) / 2, (self.height() - size.height()) / 2),
+                    self._pct_static,
+                )
+
+
+_PROGRESS_CARD_STYLE_EMBEDDED = """
+    QFrame#progressCard {
+        background: transparent;
+        border: none;
+        border-radius: 0;
+    }
+"""
+_PROGRESS_CARD_STYLE = f"""
+    QFrame#progressCard {{
+        background: {HomeColors.PROGRESS_CARD_BG};
+        border: 1px solid rgba(255,255,255,0.7);
+        border-radius: 16px;
+    }}
+"""
+_PROGRESS_LABEL_STYLE = f"color: {HomeColors.PROGRESS_LABEL_MUTED}; font-size: 13px; font-weight: 600;"
 
 
 class ProgressCard(QFrame):
@@ -201,30 +443,10 @@ class ProgressCard(QFrame):
         super().__init__(parent)
         self.setObjectName("progressCard")
         if embedded:
-            self.setStyleSheet(
-                """
-                QFrame#progressCard {
-                    background: transparent;
-                    border: none;
-                    border-radius: 0;
-                }
-                """
-            )
+            self.setStyleSheet(_PROGRESS_CARD_STYLE_EMBEDDED)
         else:
-            self.setStyleSheet(
-                f"""
-                QFrame#progressCard {{
-                    background: {HomeColors.PROGRESS_CARD_BG};
-                    border: 1px solid rgba(255,255,255,0.7);
-                    border-radius: 16px;
-                }}
-                """
-            )
-            shadow = QGraphicsDropShadowEffect(self)
-            shadow.setBlurRadius(20)
-            shadow.setOffset(0, 4)
-            shadow.setColor(QColor(0, 60, 80, 28))
-            self.setGraphicsEffect(shadow)
+            self.setStyleSheet(_PROGRESS_CARD_STYLE)
+            self._shadow = CardShadow(self, radius=16, blur=20, offset_y=4, color=QColor(0, 60, 80, 28))
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(18, 14, 18, 14)
@@ -232,15 +454,11 @@ class ProgressCard(QFrame):
 
         header = QHBoxLayout()
         self._title_label = QLabel("முன்னேற்றம்")
-        self._title_label.setStyleSheet(
-            f"color: {HomeColors.PROGRESS_LABEL_MUTED}; font-size: 13px; font-weight: 600;"
-        )
+        self._title_label.setStyleSheet(_PROGRESS_LABEL_STYLE)
         header.addWidget(self._title_label)
         header.addStretch(1)
         self._fraction_label = QLabel("0/0 (0%)")
-        self._fraction_label.setStyleSheet(
-            f"color: {HomeColors.PROGRESS_LABEL_MUTED}; font-size: 13px; font-weight: 600;"
-        )
+        self._fraction_label.setStyleSheet(_PROGRESS_LABEL_STYLE)
         header.addWidget(self._fraction_label)
         layout.addLayout(header)
 
@@ -251,43 +469,95 @@ class ProgressCard(QFrame):
             height=14,
         )
         self._bar.set_progress(0, 1, HomeColors.PROGRESS_FILL, HomeColors.PROGRESS_FILL)
+        self._last: Optional[tuple[int, int]] = None
         layout.addWidget(self._bar)
         self._bar.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
 
     def set_progress(self, current: int, total: int) -> None:
         total = max(1, total)
+        if (current, total) == self._last:
+            return
+        self._last = (current, total)
         self._bar.set_progress(current, total, HomeColors.PROGRESS_FILL, HomeColors.PROGRESS_FILL)
         pct = round((current / total) * 100)
         self._fraction_label.setText(f"{current}/{total} ({pct}%)")
 
     def setRange(self, min_val: int, max_val: int) -> None:
-        self._bar._max_value = max(1, max_val)
-        self.set_progress(min_val, self._bar._max_value)
+        self.set_progress(min_val, max(1, max_val))
 
     def setValue(self, value: int) -> None:
         self.set_progress(value, self._bar._max_value)
 
 
+_GLASS_CARD_STYLE = f"""
+    QFrame#glassCard {{
+        background: {HomeColors.CARD_BG};
+        border: 1px solid {HomeColors.CARD_BORDER};
+        border-radius: 20px;
+    }}
+"""
+
+
 class GlassCard(QFrame):
     """Glassmorphism card (ported from `test.py`)."""
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         self.setObjectName("glassCard")
-        self.setStyleSheet(
-            f"""
-            QFrame#glassCard {{
-                background: {HomeColors.CARD_BG};
-                border: 1px solid {HomeColors.CARD_BORDER};
-                border-radius: 20px;
-            }}
-            """
-        )
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(30)
-        shadow.setOffset(0, 8)
-        shadow.setColor(QColor(0, 50, 70, 40))
-        self.setGraphicsEffect(shadow)
+        self.setStyleSheet(_GLASS_CARD_STYLE)
+        # Shadow alpha is scaled by the card's 0.85 fill, as the old graphics effect did implicitly.
+        self._shadow = CardShadow(self, radius=20, blur=30, offset_y=8, color=QColor(0, 50, 70, 34))
+
+
+@lru_cache(maxsize=256)
+def _darker(hex_str: str, factor: int) -> str:
+    return QColor(hex_str).darker(factor).name()
+
+
+@lru_cache(maxsize=256)
+def _lighter(hex_str: str, factor: int) -> str:
+    return QColor(hex_str).lighter(factor).name()
+
+
+@lru_cache(maxsize=None)
+def _get_icon(name: str) -> Optional[QIcon]:
+    """Shared icon from assets/icons, or None if the file is missing (checked once per name)."""
+    path = _ICONS_DIR / name
+    return QIcon(str(path)) if path.exists() else None
+
+
+# The gradient is painted by HomeStatCard.paintEvent; the sheet only keeps inherited
+# QFrame rules from drawing a background or border underneath it.
+_STAT_CARD_STYLE = """
+    QFrame#homeStatCard {
+        background: transparent;
+        border: none;
+    }
+"""
+_STAT_LABEL_STYLE = "color: rgba(255,255,255,0.92); font-size: 12px; font-weight: 600;"
+_STAT_VALUE_STYLE = "color: white; font-size: 28px; font-weight: 900;"
+
+
+def _rounded_gradient(start: str, end: str, width: int, height: int, radius: int, dpr: float) -> QPixmap:
+    """Rounded top-left to bottom-right gradient box, cached in QPixmapCache per colors and size."""
+    key = f"thattan-gradient:{start}:{end}:{width}x{height}:{radius}:{dpr}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        image = _canvas(width, height, dpr)
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        # Same geometry as the QSS qlineargradient(x1:0, y1:0, x2:1, y2:1) it replaces.
+        gradient = QLinearGradient(0, 0, 1, 1)
+        gradient.setCoordinateMode(QGradient.ObjectBoundingMode)
+        gradient.setColorAt(0, _qcolor(start))
+        gradient.setColorAt(1, _qcolor(end))
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(gradient)
+        painter.drawRoundedRect(0, 0, width, height, radius, radius)
+        painter.end()
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
 
 
 class HomeStatCard(QFrame):
@@ -295,35 +565,157 @@ class HomeStatCard(QFrame):
         super().__init__(parent)
         self._bg_color = bg_color
         self.setObjectName("homeStatCard")
-        self.setStyleSheet(
-            f"""
-            QFrame#homeStatCard {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 {bg_color}, stop:1 {QColor(bg_color).darker(112).name()});
-                border-radius: 16px;
-                border: none;
-            }}
-            """
-        )
+        self.setStyleSheet(_STAT_CARD_STYLE)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(18, 14, 18, 14)
         layout.setSpacing(4)
         label_widget = QLabel(f"{icon} {label}")
-        label_widget.setStyleSheet("color: rgba(255,255,255,0.92); font-size: 12px; font-weight: 600;")
+        label_widget.setStyleSheet(_STAT_LABEL_STYLE)
         layout.addWidget(label_widget)
         self.value_label = QLabel(str(value))
-        self.value_label.setStyleSheet("color: white; font-size: 28px; font-weight: 900;")
+        self.value_label.setStyleSheet(_STAT_VALUE_STYLE)
         layout.addWidget(self.value_label)
 
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(16)
-        shadow.setOffset(0, 4)
-        shadow.setColor(QColor(0, 0, 0, 50))
-        self.setGraphicsEffect(shadow)
+        self._shadow = CardShadow(self, radius=16, blur=16, offset_y=4, color=QColor(0, 0, 0, 50))
 
     def set_value(self, value: str) -> None:
         self.value_label.setText(str(value))
 
+    def paintEvent(self, event) -> None:
+        dpr = self.devicePixelRatioF()
+        painter = QPainter(self)
+        background = _rounded_gradient(self._bg_color, _darker(self._bg_color, 112), self.width(), self.height(), 16, dpr)
+        painter.drawPixmap(0, 0, background)
+
+
+_ROW_STYLE_SELECTED = f"""
+    QFrame#homeLevelRowCard {{
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 rgba(255,255,255,0.98), stop:1 rgba(224,247,250,0.95));
+        border: 2px solid {HomeColors.PRIMARY};
+        border-radius: 18px;
+    }}
+"""
+_ROW_STYLE_NORMAL = f"""
+    QFrame#homeLevelRowCard {{
+        background: {HomeColors.CARD_BG};
+        border: 1px solid rgba(255,255,255,0.5);
+        border-radius: 18px;
+    }}
+"""
+_ROW_STYLE_HOVER = f"""
+    QFrame#homeLevelRowCard {{
+        background: {HomeColors.CARD_BG_HOVER};
+        border: 1px solid {HomeColors.PRIMARY_LIGHT};
+        border-radius: 18px;
+    }}
+"""
+# Locked rows: a fainter card. (QSS has no `opacity`; the muted fill stands in for it.)
+_ROW_STYLE_DISABLED = """
+    QFrame#homeLevelRowCard {
+        background: rgba(255, 255, 255, 0.65);
+        border: 1px solid rgba(255,255,255,0.35);
+        border-radius: 18px;
+    }
+"""
+# Keyed by (selected, unlocked).
+_ROW_STYLES = {
+    (True, True): _ROW_STYLE_SELECTED,
+    (False, True): _ROW_STYLE_NORMAL,
+    (True, False): _ROW_STYLE_SELECTED,
+    (False, False): _ROW_STYLE_DISABLED,
+}
+
+# Icon-box gradient (start, end) for locked rows; unlocked rows shade their progress color.
+_ICON_BOX_COLORS_LOCKED = ("#cfd8dc", "#b0bec5")
+
+
+class _RowText:
+    """A line of text HomeLevelRowCard paints itself, in place of a QLabel child."""
+
+    def __init__(self, text: str, pixel_size: int, weight: QFont.Weight, color: str, alignment: Qt.AlignmentFlag) -> None:
+        self._text = text
+        self._pixel_size = pixel_size
+        self._weight = weight
+        self._color = _qcolor(color)
+        self._alignment = alignment
+        # QStaticText keeps the shaped glyphs, so repaints skip text layout entirely.
+        self._static = QStaticText(text)
+        self._static.setTextFormat(Qt.PlainText)
+        self._font = QFont()
+        self._width = 0
+        self._line_height = 0.0
+        self.rect = QRect()
+
+    def set_base_font(self, base: QFont) -> None:
+        font = QFont(base)
+        font.setPixelSize(self._pixel_size)
+        font.setWeight(self._weight)
+        self._font = font
+        self._static.prepare(QTransform(), font)
+        # Centre on the unrounded line height, as QLabel does; QStaticText.size() rounds it up.
+        self._line_height = QFontMetricsF(font).height()
+        # What QLabel.sizeHint() reported for the same text and font.
+        self._width = QFontMetrics(font).boundingRect(QRect(0, 0, 2000, 2000), int(self._alignment), self._text).width()
+
+    def width(self) -> int:
+        return self._width
+
+    def paint(self, painter: QPainter) -> None:
+        rect = self.rect
+        size = self._static.size()
+        x = rect.x()
+        if self._alignment & Qt.AlignHCenter:
+            x += (rect.width() - size.width()) / 2
+        y = rect.y() + (rect.height() - self._line_height) / 2
+        clip = size.width() > rect.width()
+        if clip:
+            # A QLabel narrower than its text is cut off at its edge; keep that.
+            painter.save()
+            painter.setClipRect(rect)
+        painter.setFont(self._font)
+        painter.setPen(self._color)
+        painter.drawStaticText(QPointF(x, y), self._static)
+        if clip:
+            painter.restore()
+
+
+_ROW_VIEW_BUTTON_STYLE = f"""
+    QPushButton {{
+        background: {HomeColors.CARD_BG};
+        border: 1px solid {HomeColors.PRIMARY_LIGHT};
+        border-radius: 10px;
+        color: {HomeColors.PRIMARY};
+        padding: 0;
+    }}
+    QPushButton:hover {{ background: rgba(255,255,255,0.95); border-color: {HomeColors.PRIMARY}; }}
+"""
+_ROW_RESTART_BUTTON_STYLE = f"""
+    QPushButton {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 {HomeColors.PRIMARY_LIGHT}, stop:1 {HomeColors.PRIMARY});
+        border: none;
+        border-radius: 10px;
+        color: white;
+        padding: 0;
+    }}
+    QPushButton:hover {{ background: {HomeColors.PRIMARY}; }}
+"""
+
+
+def _row_icon_button(icon_name: str, tooltip: str, style: str) -> QPushButton:
+    """40x40 icon button shown on completed level rows."""
+    button = QPushButton()
+    icon = _get_icon(icon_name)
+    if icon is not None:
+        button.setIcon(icon)
+    button.setIconSize(QSize(20, 20))
+    button.setToolTip(tooltip)
+    button.setFixedSize(40, 40)
+    button.setCursor(_cursor(Qt.PointingHandCursor))
+    button.setStyleSheet(style)
+    return button
+
 
 class HomeLevelRowCard(QFrame):
     """Clickable row card for one level (ported from `test.py` and wired to real levels)."""
@@ -347,177 +739,190 @@ class HomeLevelRowCard(QFrame):
     ) -> None:
         super().__init__(parent)
         self._level_key = level_key
-        self._unlocked = bool(unlocked)
-        self._selected = bool(selected)
-        self._completed = bool(completed)
+        self._level_id = level_id
+        self._title = title
+        self._icon = icon
         self._on_click = on_click
         self._on_restart = on_restart
         self._on_view = on_view
+        self._state: Optional[tuple[int, int, bool, bool, bool]] = None
 
-        self.setCursor(Qt.PointingHandCursor if self._unlocked else Qt.ForbiddenCursor)
         self.setObjectName("homeLevelRowCard")
         self.setFixedHeight(96)
 
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(18, 14, 18, 14)
-        layout.setSpacing(16)
-
-        # Icon container
-        icon_container = QFrame()
-        icon_container.setFixedSize(56, 56)
-        icon_container.setObjectName("levelIconBox")
-        icon_color = self._progress_color(current, total)
-        if self._unlocked:
-            icon_container.setStyleSheet(
-                f"""
-                QFrame#levelIconBox {{
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 {icon_color}, stop:1 {QColor(icon_color).darker(115).name()});
-                    border-radius: 16px;
-                }}
-                """
-            )
-        else:
-            icon_container.setStyleSheet(
-                """
-                QFrame#levelIconBox {
-                    background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                        stop:0 #cfd8dc, stop:1 #b0bec5);
-                    border-radius: 16px;
-                }
-                """
-            )
+        # The icon box and the text are painted (see paintEvent); only the progress bar and the
+        # buttons of completed rows are child widgets, positioned by _layout_children since the
+        # row is fixed-height and simple enough not to need layouts.
+        self._icon_rect = QRect()
+        self._bar = HomeProgressBar(self)
+        # View/restart buttons, created the first time the level is shown as completed.
+        self._button_widgets: list[QPushButton] = []
+
+        self.update_state(current=current, total=total, unlocked=unlocked, selected=selected, completed=completed)
+        # Shadow alpha is scaled by the card's 0.85 fill, as the old graphics effect did implicitly.
+        self._shadow = CardShadow(self, radius=18, blur=20, offset_y=4, color=QColor(0, 60, 80, 30))
+
+    def update_state(self, *, current: int, total: int, unlocked: bool, selected: bool, completed: bool) -> None:
+        """Show new progress for the same level, so a list refresh can reuse the card."""
+        state = (current, total, bool(unlocked), bool(selected), bool(completed))
+        if state == self._state:
+            return
+        self._state = state
+        self._unlocked = bool(unlocked)
+        self._selected = bool(selected)
+        self._completed = bool(completed)
 
-        icon_layout = QVBoxLayout(icon_container)
-        icon_layout.setContentsMargins(0, 0, 0, 0)
-        icon_text = icon if self._unlocked else "🔒"
-        icon_label = QLabel(icon_text)
-        icon_label.setAlignment(Qt.AlignCenter)
-        icon_label.setStyleSheet("color: white; font-size: 24px; font-weight: 900;")
-        icon_layout.addWidget(icon_label)
+        self.setCursor(_cursor(Qt.PointingHandCursor if self._unlocked else Qt.ForbiddenCursor))
 
-        layout.addWidget(icon_container)
+        icon_color = self._progress_color(current, total)
+        self._icon_box_colors = (icon_color, _darker(icon_color, 115)) if self._unlocked else _ICON_BOX_COLORS_LOCKED
+        left = Qt.AlignLeft | Qt.AlignVCenter
+        self._icon_text = _RowText(self._icon if self._unlocked else "🔒", 24, QFont.Weight.Black, "white", Qt.AlignCenter)
 
         # Info section
-        info_widget = QWidget()
-        info_layout = QVBoxLayout(info_widget)
-        info_layout.setContentsMargins(0, 0, 0, 0)
-        info_layout.setSpacing(6)
-
-        title_row = QHBoxLayout()
-        title_row.setContentsMargins(0, 0, 0, 0)
         title_color = HomeColors.TEXT_PRIMARY if self._unlocked else HomeColors.TEXT_MUTED
-        title_label = QLabel(f"நிலை {level_id} — {title}")
-        title_label.setStyleSheet(f"color: {title_color}; font-size: 15px; font-weight: 800;")
-        title_row.addWidget(title_label)
-        title_row.addStretch(1)
-        count_label = QLabel(f"{current}/{total}")
-        count_label.setStyleSheet(f"color: {icon_color}; font-size: 13px; font-weight: 900;")
-        title_row.addWidget(count_label)
-        info_layout.addLayout(title_row)
-
-        self._bar = HomeProgressBar()
-        self._bar.set_progress(current, max(1, total), QColor(icon_color).lighter(120).name(), icon_color)
-        info_layout.addWidget(self._bar)
+        title = f"நிலை {self._level_id} — {self._title}"
+        self._title_text = _RowText(title, 15, QFont.Weight.ExtraBold, title_color, left)
+        self._count_text = _RowText(f"{current}/{total}", 13, QFont.Weight.Black, icon_color, left)
+
+        self._bar.set_progress(current, max(1, total), _lighter(icon_color, 120), icon_color)
 
         percent = self._progress_percent(current, total)
-        percent_label = QLabel(f"{percent}% முடிந்தது")
-        percent_label.setStyleSheet(f"color: {HomeColors.TEXT_MUTED}; font-size: 11px; font-weight: 600;")
-        info_layout.addWidget(percent_label)
+        self._percent_text = _RowText(f"{percent}% முடிந்தது", 11, QFont.Weight.DemiBold, HomeColors.TEXT_MUTED, left)
 
-        layout.addWidget(info_widget, 1)
+        # The row's text is painted rather than held in labels; expose it to assistive tech.
+        self.setAccessibleName(title)
+        self.setAccessibleDescription(f"{current}/{total}, {percent}% முடிந்தது")
 
+        # Trailing content: view/restart buttons on completed rows, an arrow on other unlocked rows.
+        self._buttons: list[QPushButton] = []
+        self._arrow_text: Optional[_RowText] = None
         if self._unlocked:
             if self._completed and self._on_restart is not None:
-                btn_row = QHBoxLayout()
-                btn_row.setSpacing(8)
-                icons_dir = Path(__file__).resolve().parent.parent / "assets" / "icons"
-                icon_sz = 20
-                view_icon_path = icons_dir / "icon_view.svg"
-                restart_icon_path = icons_dir / "icon_restart.svg"
-                view_btn = QPushButton()
-                if view_icon_path.exists():
-                    view_btn.setIcon(QIcon(str(view_icon_path)))
-                view_btn.setIconSize(QSize(icon_sz, icon_sz))
-                view_btn.setToolTip("பார்க்க")
-                view_btn.setFixedSize(40, 40)
-                view_btn.setCursor(Qt.PointingHandCursor)
-                view_btn.setStyleSheet(
-                    f"""
-                    QPushButton {{
-                        background: {HomeColors.CARD_BG};
-                        border: 1px solid {HomeColors.PRIMARY_LIGHT};
-                        border-radius: 10px;
-                        color: {HomeColors.PRIMARY};
-                        padding: 0;
-                    }}
-                    QPushButton:hover {{ background: rgba(255,255,255,0.95); border-color: {HomeColors.PRIMARY}; }}
-                    """
-                )
-                view_btn.clicked.connect(
-                    lambda: (self._on_view(self._level_key) if self._on_view is not None else self._on_click(self._level_key))
-                )
-                restart_btn = QPushButton()
-                if restart_icon_path.exists():
-                    restart_btn.setIcon(QIcon(str(restart_icon_path)))
-                restart_btn.setIconSize(QSize(icon_sz, icon_sz))
-                restart_btn.setToolTip("மீண்டும் தொடங்கு")
-                restart_btn.setFixedSize(40, 40)
-                restart_btn.setCursor(Qt.PointingHandCursor)
-                restart_btn.setStyleSheet(
-                    f"""
-                    QPushButton {{
-                        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                            stop:0 {HomeColors.PRIMARY_LIGHT}, stop:1 {HomeColors.PRIMARY});
-                        border: none;
-                        border-radius: 10px;
-                        color: white;
-                        padding: 0;
-                    }}
-                    QPushButton:hover {{ background: {HomeColors.PRIMARY}; }}
-                    """
-                )
-                restart_btn.clicked.connect(lambda: self._on_restart(self._level_key))
-                btn_row.addWidget(view_btn)
-                btn_row.addWidget(restart_btn)
-                layout.addLayout(btn_row)
+                self._buttons = self._completed_buttons()
             else:
-                arrow = QLabel("›")
-                arrow.setStyleSheet(f"color: {HomeColors.PRIMARY_LIGHT}; font-size: 28px; font-weight: 900;")
-                layout.addWidget(arrow)
+                self._arrow_text = _RowText("›", 28, QFont.Weight.Black, HomeColors.PRIMARY_LIGHT, left)
+        for button in self._button_widgets:
+            button.setVisible(bool(self._buttons))
+
+        self._texts = [self._icon_text, self._title_text, self._count_text, self._percent_text]
+        if self._arrow_text is not None:
+            self._texts.append(self._arrow_text)
+        self._update_fonts()
 
         self._apply_style()
+        self._layout_children()
+        self.updateGeometry()
+        self.update()
 
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(20)
-        shadow.setOffset(0, 4)
-        shadow.setColor(QColor(0, 60, 80, 35))
-        self.setGraphicsEffect(shadow)
+    def _completed_buttons(self) -> list[QPushButton]:
+        if not self._button_widgets:
+            view_btn = _row_icon_button("icon_view.svg", "பார்க்க", _ROW_VIEW_BUTTON_STYLE)
+            view_btn.clicked.connect(
+                lambda: (self._on_view(self._level_key) if self._on_view is not None else self._on_click(self._level_key))
+            )
+            restart_btn = _row_icon_button("icon_restart.svg", "மீண்டும் தொடங்கு", _ROW_RESTART_BUTTON_STYLE)
+            restart_btn.clicked.connect(lambda: self._on_restart(self._level_key))
+            self._button_widgets = [view_btn, restart_btn]
+            for button in self._button_widgets:
+                button.setParent(self)
+        return self._button_widgets
 
     def _apply_style(self) -> None:
-        if self._selected:
-            self.setStyleSheet(
-                f"""
-                QFrame#homeLevelRowCard {{
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 rgba(255,255,255,0.98), stop:1 rgba(224,247,250,0.95));
-                    border: 2px solid {HomeColors.PRIMARY};
-                    border-radius: 18px;
-                }}
-                """
-            )
-        else:
-            self.setStyleSheet(
-                f"""
-                QFrame#homeLevelRowCard {{
-                    background: {HomeColors.CARD_BG};
-                    border: 1px solid rgba(255,255,255,0.5);
-                    border-radius: 18px;
-                }}
-                """
-            )
-        if not self._unlocked:
-            self.setStyleSheet(self.styleSheet() + "QFrame#homeLevelRowCard { opacity: 0.65; }")
+        self.setStyleSheet(_ROW_STYLES[(self._selected, self._unlocked)])
+
+    # Spacing and margins of the row, as the original layouts had them.
+    _MARGIN_X = 18
+    _MARGIN_Y = 14
+    _SPACING = 16
+    _INFO_SPACING = 6
+    _BUTTON_SPACING = 8
+
+    def _update_fonts(self) -> None:
+        base = self.font()
+        for text in self._texts:
+            text.set_base_font(base)
+
+    def _trailing_width(self) -> int:
+        if self._arrow_text is not None:
+            return self._arrow_text.width()
+        if not self._buttons:
+            return 0
+        return sum(b.width() for b in self._buttons) + self._BUTTON_SPACING * (len(self._buttons) - 1)
+
+    def _info_min_width(self) -> int:
+        title_row = self._title_text.width() + self._INFO_SPACING + self._count_text.width()
+        return max(title_row, self._bar.minimumWidth(), self._percent_text.width())
+
+    def minimumSizeHint(self) -> QSize:
+        margins = self.contentsMargins()
+        width = margins.left() + margins.right() + 2 * self._MARGIN_X + 56 + self._SPACING + self._info_min_width()
+        if self._buttons or self._arrow_text is not None:
+            width += self._SPACING + self._trailing_width()
+        return QSize(width, 96)
+
+    def sizeHint(self) -> QSize:
+        return self.minimumSizeHint()
+
+    def _layout_children(self) -> None:
+        area = self.contentsRect().adjusted(self._MARGIN_X, self._MARGIN_Y, -self._MARGIN_X, -self._MARGIN_Y)
+        x, y, h = area.x(), area.y(), area.height()
+        right = area.x() + area.width()
+
+        self._icon_rect = QRect(x, y + (h - 56) // 2, 56, 56)
+        self._icon_text.rect = self._icon_rect
+
+        # Trailing content is right-aligned and vertically centred.
+        if self._buttons:
+            for button in reversed(self._buttons):
+                right -= button.width()
+                button.move(right, y + (h - button.height()) // 2)
+                right -= self._BUTTON_SPACING
+            right += self._BUTTON_SPACING - self._SPACING
+        elif self._arrow_text is not None:
+            width = self._arrow_text.width()
+            right -= width
+            self._arrow_text.rect = QRect(right, y, width, h)
+            right -= self._SPACING
+
+        # Info column: title row, bar, percentage. The two text rows share the height the bar
+        # and spacing leave, as the stacked layout did.
+        info_x = x + 56 + self._SPACING
+        info_w = max(0, right - info_x)
+        bar_h = self._bar.height()
+        text_h = h - bar_h - 2 * self._INFO_SPACING
+        title_h = (text_h + 1) // 2
+        percent_h = text_h - title_h
+        count_w = self._count_text.width()
+        title_w = min(self._title_text.width(), max(0, info_w - count_w - self._INFO_SPACING))
+        self._title_text.rect = QRect(info_x, y, title_w, title_h)
+        self._count_text.rect = QRect(info_x + info_w - count_w, y, count_w, title_h)
+        bar_y = y + title_h + self._INFO_SPACING
+        self._bar.setGeometry(info_x, bar_y, info_w, bar_h)
+        self._percent_text.rect = QRect(info_x, bar_y + bar_h + self._INFO_SPACING, info_w, percent_h)
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self._layout_children()
+
+    def changeEvent(self, event) -> None:
+        super().changeEvent(event)
+        # Selection swaps a 1px border for a 2px one, which moves the contents rect.
+        if event.type() == QEvent.Type.StyleChange:
+            self._layout_children()
+        elif event.type() == QEvent.Type.FontChange:
+            self._update_fonts()
+            self._layout_children()
+            self.update()
+
+    def paintEvent(self, event) -> None:
+        super().paintEvent(event)
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        start, end = self._icon_box_colors
+        painter.drawPixmap(self._icon_rect.topLeft(), _rounded_gradient(start, end, 56, 56, 16, self.devicePixelRatioF()))
+        for text in self._texts:
+            text.paint(painter)
 
     @staticmethod
     def _progress_percent(current: int, total: int) -> int:
@@ -526,33 +931,23 @@ class HomeLevelRowCard(QFrame):
         return round((current / total) * 100)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _progress_color(current: int, total: int) -> str:
         if total <= 0:
             return HomeColors.TEXT_MUTED
-        percent = (current / total) * 100
-        if percent == 0:
+        if current == 0:
             return "#90a4ae"
+        # Integer percent: floor division keeps the < 30 / < 70 thresholds exact.
+        percent = current * 100 // total
         if percent < 30:
             return HomeColors.CORAL
         if percent < 70:
             return HomeColors.AMBER
         return HomeColors.MINT
 
-    def set_selected(self, selected: bool) -> None:
-        self._selected = bool(selected)
-        self._apply_style()
-
     def enterEvent(self, event) -> None:
         if self._unlocked and not self._selected:
-            self.setStyleSheet(
-                f"""
-                QFrame#homeLevelRowCard {{
-                    background: {HomeColors.CARD_BG_HOVER};
-                    border: 1px solid {HomeColors.PRIMARY_LIGHT};
-                    border-radius: 18px;
-                }}
-                """
-            )
+            self.setStyleSheet(_ROW_STYLE_HOVER)
         super().enterEvent(event)
 
     def leaveEvent(self, event) -> None:
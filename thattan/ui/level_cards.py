@@ -2,19 +2,20 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Callable, Optional
 
 from PySide6.QtCore import Qt, QPointF, QRectF
 from PySide6.QtGui import (
     QBrush,
     QColor,
+    QGradient,
     QLinearGradient,
     QPainter,
     QPainterPath,
     QPen,
 )
 from PySide6.QtWidgets import (
-    QGraphicsDropShadowEffect,
     QHBoxLayout,
     QLabel,
     QProgressBar,
@@ -24,6 +25,73 @@ from PySide6.QtWidgets import (
 
 from thattan.ui.colors import blend_hex
 from thattan.ui.models import LevelState
+from thattan.ui.shadows import CardShadow
+
+# Painter colors, built once rather than on every paint.
+_RING_TRACK = QColor(255, 255, 255, 90)
+_RING_FILL_START = QColor(255, 255, 255, 230)
+_RING_FILL_END = QColor(255, 255, 255, 170)
+_CONNECTOR_COLOR = QColor(120, 130, 150, 90)
+_CARD_BORDER = QPen(QColor(255, 255, 255, 102))
+_CARD_BORDER_HOVER = QPen(QColor(255, 255, 255, 173))
+
+
+@lru_cache(maxsize=16)
+def _card_brush(base_color: str) -> QBrush:
+    """Top-to-bottom card fill; one per palette color, shared by every card using it."""
+    gradient = QLinearGradient(0, 0, 0, 1)
+    gradient.setCoordinateMode(QGradient.ObjectBoundingMode)
+    gradient.setColorAt(0, QColor(blend_hex(base_color, "#FFFFFF", 0.18)))
+    gradient.setColorAt(1, QColor(blend_hex(base_color, "#000000", 0.08)))
+    return QBrush(gradient)
+
+
+# The card's own fill and border are painted in LevelCard.paintEvent with _card_brush; the sheet
+# styles its children only, so it is the same for every card.
+_LEVEL_CARD_STYLE = """
+    QWidget#levelCardHeader {
+        background: rgba(255, 255, 255, 0.18);
+        border-radius: 12px;
+        border: 1px solid rgba(255, 255, 255, 0.22);
+    }
+    QLabel#levelCardTitle {
+        color: rgba(255, 255, 255, 0.95);
+        font-weight: 900;
+        font-size: 13px;
+    }
+    QLabel#levelCardLockBadge {
+        background: rgba(255, 255, 255, 0.30);
+        border-radius: 12px;
+        font-size: 13px;
+    }
+    QLabel#levelCardCenter {
+        color: rgba(255, 255, 255, 0.96);
+        font-weight: 900;
+        font-size: 18px;
+    }
+    QLabel#levelCardStartPill {
+        background: rgba(255, 255, 255, 0.92);
+        color: rgba(15, 23, 42, 0.74);
+        padding: 0px 14px;
+        border-radius: 15px;
+        font-size: 12px;
+        font-weight: 900;
+    }
+    QProgressBar#levelCardXpBar {
+        border: none;
+        border-radius: 5px;
+        background: rgba(255, 255, 255, 0.22);
+    }
+    QProgressBar#levelCardXpBar::chunk {
+        border-radius: 5px;
+        background: rgba(255, 255, 255, 0.70);
+    }
+    QLabel#levelCardXpText {
+        color: rgba(255, 255, 255, 0.92);
+        font-weight: 800;
+        font-size: 12px;
+    }
+"""
 
 
 class LevelCard(QWidget):
@@ -46,9 +114,12 @@ class LevelCard(QWidget):
         self._progress: float = 0.0
         self._is_current: bool = False
         self._is_completed: bool = False
+        # Ring pens depend only on the ring rect; rebuilt when the center label moves or resizes.
+        self._ring_rect: Optional[QRectF] = None
+        self._bg_pen: Optional[QPen] = None
+        self._fg_pen: Optional[QPen] = None
 
         self.setObjectName("levelCard")
-        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         self.setAttribute(Qt.WidgetAttribute.WA_Hover, True)
         self.setMouseTracking(True)
         self.setCursor(Qt.PointingHandCursor)
@@ -109,74 +180,12 @@ class LevelCard(QWidget):
         layout.addWidget(self._progress_text)
 
         # Soft shadow like the reference cards
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(26)
-        shadow.setOffset(0, 10)
-        shadow.setColor(QColor(15, 23, 42, 80))
-        self.setGraphicsEffect(shadow)
+        self._shadow = CardShadow(self, radius=16, blur=26, offset_y=10, color=QColor(15, 23, 42, 80))
 
         self._apply_styles()
 
     def _apply_styles(self) -> None:
-        card_top = blend_hex(self._base_color, "#FFFFFF", 0.18)
-        card_bottom = blend_hex(self._base_color, "#000000", 0.08)
-        self.setStyleSheet(
-            f"""
-            QWidget#levelCard {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 {card_top},
-                    stop:1 {card_bottom}
-                );
-                border-radius: 16px;
-                border: 1px solid rgba(255, 255, 255, 0.40);
-            }}
-            QWidget#levelCard:hover {{
-                border: 1px solid rgba(255, 255, 255, 0.68);
-            }}
-            QWidget#levelCardHeader {{
-                background: rgba(255, 255, 255, 0.18);
-                border-radius: 12px;
-                border: 1px solid rgba(255, 255, 255, 0.22);
-            }}
-            QLabel#levelCardTitle {{
-                color: rgba(255, 255, 255, 0.95);
-                font-weight: 900;
-                font-size: 13px;
-            }}
-            QLabel#levelCardLockBadge {{
-                background: rgba(255, 255, 255, 0.30);
-                border-radius: 12px;
-                font-size: 13px;
-            }}
-            QLabel#levelCardCenter {{
-                color: rgba(255, 255, 255, 0.96);
-                font-weight: 900;
-                font-size: 18px;
-            }}
-            QLabel#levelCardStartPill {{
-                background: rgba(255, 255, 255, 0.92);
-                color: rgba(15, 23, 42, 0.74);
-                padding: 0px 14px;
-                border-radius: 15px;
-                font-size: 12px;
-                font-weight: 900;
-            }}
-            QProgressBar#levelCardXpBar {{
-                border: none;
-                border-radius: 5px;
-                background: rgba(255, 255, 255, 0.22);
-            }}
-            QProgressBar#levelCardXpBar::chunk {{
-                border-radius: 5px;
-                background: rgba(255, 255, 255, 0.70);
-            }}
-            QLabel#levelCardXpText {{
-                color: rgba(255, 255, 255, 0.92);
-                font-weight: 800;
-                font-size: 12px;
-            }}
-            """
-        )
+        self.setStyleSheet(_LEVEL_CARD_STYLE)
 
     def set_state(self, state: LevelState) -> None:
         task_count = max(1, len(state.level.tasks))
@@ -217,8 +226,22 @@ class LevelCard(QWidget):
             self._on_click(self._level_key)
         super().mousePressEvent(event)
 
+    def enterEvent(self, event) -> None:
+        self.update()  # hover border
+        super().enterEvent(event)
+
+    def leaveEvent(self, event) -> None:
+        self.update()
+        super().leaveEvent(event)
+
     def paintEvent(self, event) -> None:
         super().paintEvent(event)
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        # Fill and 1px border share one outline, as the QSS background and border did.
+        painter.setPen(_CARD_BORDER_HOVER if self.underMouse() else _CARD_BORDER)
+        painter.setBrush(_card_brush(self._base_color))
+        painter.drawRoundedRect(QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5), 15.5, 15.5)
         if (not self._unlocked) or self._is_completed:
             return
         # Draw progress ring behind the center label
@@ -232,25 +255,33 @@ class LevelCard(QWidget):
             max(10, r.height() - 2 * pad),
         )
 
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing, True)
+        if ring_rect != self._ring_rect:
+            self._rebuild_ring_pens(ring_rect)
 
         # background ring
-        bg_pen = QPen(QColor(255, 255, 255, 90))
-        bg_pen.setWidth(max(6, int(ring_rect.width() * 0.09)))
-        bg_pen.setCapStyle(Qt.RoundCap)
-        painter.setPen(bg_pen)
+        painter.setPen(self._bg_pen)
         painter.drawArc(ring_rect, 90 * 16, -360 * 16)
 
         # progress arc
-        grad = QLinearGradient(ring_rect.topLeft(), ring_rect.bottomRight())
-        grad.setColorAt(0.0, QColor(255, 255, 255, 230))
-        grad.setColorAt(1.0, QColor(255, 255, 255, 170))
-        pen = QPen(QBrush(grad), bg_pen.width())
-        pen.setCapStyle(Qt.RoundCap)
-        painter.setPen(pen)
+        painter.setPen(self._fg_pen)
         painter.drawArc(ring_rect, 90 * 16, -int(360 * 16 * self._progress))
 
+    def _rebuild_ring_pens(self, ring_rect: QRectF) -> None:
+        width = max(6, int(ring_rect.width() * 0.09))
+        bg_pen = QPen(_RING_TRACK)
+        bg_pen.setWidth(width)
+        bg_pen.setCapStyle(Qt.RoundCap)
+
+        grad = QLinearGradient(ring_rect.topLeft(), ring_rect.bottomRight())
+        grad.setColorAt(0.0, _RING_FILL_START)
+        grad.setColorAt(1.0, _RING_FILL_END)
+        fg_pen = QPen(QBrush(grad), width)
+        fg_pen.setCapStyle(Qt.RoundCap)
+
+        self._ring_rect = ring_rect
+        self._bg_pen = bg_pen
+        self._fg_pen = fg_pen
+
 
 class LevelMapWidget(QWidget):
     """A canvas that places LevelCards like a 'journey map' and draws connectors."""
@@ -265,6 +296,12 @@ class LevelMapWidget(QWidget):
         self._on_level_clicked = on_level_clicked
         self._cards: list[LevelCard] = []
         self._states: list[LevelState] = []
+        self._connector_path: Optional[QPainterPath] = None
+        self._connector_pen = QPen(_CONNECTOR_COLOR)
+        self._connector_pen.setWidth(6)
+        self._connector_pen.setCapStyle(Qt.RoundCap)
+        # (width, height, visible cards) the current card geometry was computed for.
+        self._layout_key: Optional[tuple[int, int, int]] = None
 
         # Palette inspired by the reference screen
         self._palette = ["#19A7D9", "#F5B23B", "#F26A5A", "#F0A93B", "#2FBF93", "#4D79FF"]
@@ -310,7 +347,14 @@ class LevelMapWidget(QWidget):
     def _relayout_cards(self) -> None:
         visible = [c for c in self._cards if c.isVisible()]
         if not visible:
+            self._connector_path = None
+            self._layout_key = None
             return
+        # Cards are always shown as a prefix of self._cards, so the count identifies them.
+        key = (self.width(), self.height(), len(visible))
+        if key == self._layout_key:
+            return
+        self._layout_key = key
         w = max(1, self.width())
         h = max(1, self.height())
 
@@ -335,25 +379,24 @@ class LevelMapWidget(QWidget):
             y = int(pad_y + ry * max(1, (h - card_h - 2 * pad_y)))
             card.setGeometry(x, y, card_w, card_h)
 
-    def paintEvent(self, event) -> None:
-        super().paintEvent(event)
-        visible = [c for c in self._cards if c.isVisible()]
-        if len(visible) < 2:
-            return
-
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing, True)
-        pen = QPen(QColor(120, 130, 150, 90))
-        pen.setWidth(6)
-        pen.setCapStyle(Qt.RoundCap)
-        painter.setPen(pen)
-
+        # Connectors depend only on card positions, so they are built here, not per paint.
+        path = QPainterPath()
         for a, b in zip(visible, visible[1:]):
             pa = a.geometry().center()
             pb = b.geometry().center()
             start = QPointF(pa.x(), pa.y())
             end = QPointF(pb.x(), pb.y())
             midx = (start.x() + end.x()) / 2.0
-            path = QPainterPath(start)
+            path.moveTo(start)
             path.cubicTo(QPointF(midx, start.y()), QPointF(midx, end.y()), end)
-            painter.drawPath(path)
+        self._connector_path = path if len(visible) >= 2 else None
+
+    def paintEvent(self, event) -> None:
+        super().paintEvent(event)
+        if self._connector_path is None:
+            return
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setPen(self._connector_pen)
+        painter.drawPath(self._connector_path)
@@ -5,10 +5,12 @@ import re
 import os
 import logging
 import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Iterator, Mapping, Optional
 
-from PySide6.QtCore import Qt, QDateTime, QTimer, QSize, QPropertyAnimation, QEventLoop
+from PySide6.QtCore import Qt, QTimer, QSize
 from PySide6.QtGui import (
     QCloseEvent,
     QColor,
@@ -16,7 +18,9 @@ from PySide6.QtGui import (
     QGuiApplication,
     QIcon,
     QKeyEvent,
+    QPalette,
     QPixmap,
+    QPixmapCache,
     QShortcut,
 )
 from PySide6.QtWidgets import (
@@ -28,8 +32,6 @@ from PySide6.QtWidgets import (
     QFrame,
     QMainWindow,
     QPushButton,
-    QGraphicsOpacityEffect,
-    QGraphicsDropShadowEffect,
     QScrollArea,
     QSizePolicy,
     QStackedWidget,
@@ -45,7 +47,6 @@ from thattan.ui.about_overlay import AboutOverlay
 from thattan.ui.colors import HomeColors
 from thattan.ui.custom_overlay import ResetConfirmOverlay, LevelCompletedOverlay
 from thattan.ui.home_widgets import (
-    AspectRatioWidget,
     CoolBackground,
     GlassCard,
     HomeLevelRowCard,
@@ -53,9 +54,247 @@ from thattan.ui.home_widgets import (
     HomeStatCard,
     ProgressCard,
 )
-from thattan.ui.level_cards import LevelCard, LevelMapWidget
+from thattan.ui.level_cards import LevelMapWidget
 from thattan.ui.models import LevelState
-from thattan.ui.typing_widgets import HeroLetterLabel, LetterSequenceWidget
+from thattan.ui.shadows import CardShadow
+from thattan.ui.typing_widgets import ErrorFlashOverlay, HeroLetterLabel, LetterSequenceWidget
+
+# Shifted punctuation -> (unshifted key label, needs_shift) on a US keyboard.
+_SHIFTED_PUNCTUATION = {
+    "!": ("1", True),
+    "@": ("2", True),
+    "#": ("3", True),
+    "$": ("4", True),
+    "%": ("5", True),
+    "^": ("6", True),
+    "&": ("7", True),
+    "*": ("8", True),
+    "(": ("9", True),
+    ")": ("0", True),
+    "_": ("-", True),
+    "+": ("=", True),
+    "{": ("[", True),
+    "}": ("]", True),
+    "|": ("\\", True),
+    ":": (";", True),
+    "\"": ("'", True),
+    "<": (",", True),
+    ">": (".", True),
+    "?": ("/", True),
+    "~": ("`", True),
+}
+
+# Key label -> (hand, finger) for touch typing on the QWERTY/Tamil99 layout. Each label is
+# stored as written here (upper case) and in lower and title case ("a", "Space", "Shift"), the
+# forms the keyboard and keystroke sequence use, so lookups need no case folding.
+# SHIFT appears once, as the right pinky: that is only the default for the Shift key itself,
+# since _shift_side_for_key picks the Shift opposite the hand typing each shifted key.
+_KEY_TO_FINGER: Mapping[str, tuple[str, str]] = MappingProxyType({
+    label: hand_finger
+    for key, hand_finger in {
+        **dict.fromkeys(["`", "1", "Q", "A", "Z", "TAB", "CAPS", "CTRL"], ("left", "pinky")),
+        **dict.fromkeys(["2", "W", "S", "X"], ("left", "ring")),
+        **dict.fromkeys(["3", "E", "D", "C"], ("left", "middle")),
+        **dict.fromkeys(["4", "5", "R", "T", "F", "G", "V", "B"], ("left", "index")),
+        **dict.fromkeys(["SPACE", " ", "ALT"], ("left", "thumb")),
+        **dict.fromkeys(["6", "7", "Y", "U", "H", "J", "N", "M"], ("right", "index")),
+        **dict.fromkeys(["8", "I", "K", ","], ("right", "middle")),
+        **dict.fromkeys(["9", "O", "L", "."], ("right", "ring")),
+        **dict.fromkeys(
+            ["0", "-", "=", "P", "[", "]", "\\", ";", "'", "/", "ENTER", "BACKSPACE", "SHIFT"], ("right", "pinky")
+        ),
+    }.items()
+    for label in (key, key.lower(), key.capitalize())
+})
+_SHIFT_LABELS = frozenset({"SHIFT", "shift", "Shift"})
+
+
+def _finger_for_key(key_label: str) -> tuple[str, str]:
+    """(hand, finger) for a key label; unknown keys default to the right index finger."""
+    hand_finger = _KEY_TO_FINGER.get(key_label)
+    if hand_finger is None:
+        # Only labels in an unusual case ("sPACE") reach the case-folding fallback.
+        hand_finger = _KEY_TO_FINGER.get(key_label.upper(), ('right', 'index'))
+    return hand_finger
+
+
+_FINGER_NAMES_TAMIL = {
+    'thumb': 'கட்டைவிரல்',
+    'index': 'சுட்டுவிரல்',
+    'middle': 'நடுவிரல்',
+    'ring': 'மோதிரவிரல்',
+    'pinky': 'சிறுவிரல்'
+}
+_HAND_NAMES_TAMIL = {
+    'left': 'இடது',
+    'right': 'வலது'
+}
+# (hand, finger) -> (English, Tamil) display names, e.g. ("Left Index", "இடது சுட்டுவிரல்").
+_FINGER_DISPLAY_NAMES: Mapping[tuple[str, str], tuple[str, str]] = MappingProxyType({
+    (hand, finger): (f"{hand.capitalize()} {finger.capitalize()}", f"{hand_ta} {finger_ta}")
+    for hand, hand_ta in _HAND_NAMES_TAMIL.items()
+    for finger, finger_ta in _FINGER_NAMES_TAMIL.items()
+})
+
+
+def _guidance_for(label: str, hand_finger: tuple[str, str]) -> tuple[tuple[str, str], tuple[str, str], str]:
+    # Shift rule: a key typed with the left hand uses the right Shift and vice versa. The Shift
+    # key itself has no key to pair with and keeps the table's default side.
+    shift_side = 'right' if hand_finger[0] == 'left' else 'left'
+    shift_names = hand_finger if label in _SHIFT_LABELS else (shift_side, 'pinky')
+    return (_FINGER_DISPLAY_NAMES[hand_finger], _FINGER_DISPLAY_NAMES[shift_names], shift_side)
+
+
+# Key label -> (finger names, Shift finger names when the key needs Shift, Shift side), so the
+# finger guidance shown on every keystroke is a single lookup.
+_KEY_GUIDANCE: Mapping[str, tuple[tuple[str, str], tuple[str, str], str]] = MappingProxyType({
+    label: _guidance_for(label, hand_finger) for label, hand_finger in _KEY_TO_FINGER.items()
+})
+# Unknown keys are guided like the right index finger.
+_DEFAULT_KEY_GUIDANCE = _guidance_for("", ('right', 'index'))
+
+
+def _key_guidance(key_label: str) -> tuple[tuple[str, str], tuple[str, str], str]:
+    guidance = _KEY_GUIDANCE.get(key_label)
+    if guidance is None:
+        # Only labels in an unusual case ("sPACE") reach the case-folding fallback.
+        guidance = _KEY_GUIDANCE.get(key_label.upper(), _DEFAULT_KEY_GUIDANCE)
+    return guidance
+
+
+_HEX_COLOR = re.compile(r"#[0-9A-Fa-f]{6}")
+_LEVEL_KEY = re.compile(r"level(\d+)")
+# Home screen row card icon and Tamil title per level number (from the "levelN" key).
+_LEVEL_ICONS: Mapping[int, str] = MappingProxyType({0: "அ", 1: "ஆ", 2: "க்", 3: "கா", 4: "📝"})
+_LEVEL_TITLES: Mapping[int, str] = MappingProxyType({
+    0: "அடிப்படை எழுத்துகள்",
+    1: "எளிய சொற்கள்",
+    2: "எளிய வாக்கியங்கள்",
+    3: "நடுத்தர வாக்கியங்கள்",
+    4: "நீளமான வாக்கியங்கள்",
+})
+# Light theme palette, shared by every stylesheet the window builds.
+_THEME_COLORS: Mapping[str, str] = MappingProxyType({
+    # Background: neutral light grey with soft teal tint
+    'bg_main': '#EEF6F6',
+    'bg_container': 'rgba(255, 255, 255, 0.34)',
+    'bg_card': 'rgba(255, 255, 255, 0.24)',
+    'bg_input': 'rgba(255, 255, 255, 0.38)',
+    'bg_hover': 'rgba(255, 255, 255, 0.46)',
+
+    # Typing text: dark neutral
+    'text_primary': '#1F2933',
+    'text_secondary': '#334155',
+    'text_muted': '#64748B',
+
+    'border': 'rgba(15, 23, 42, 0.14)',
+    'border_light': 'rgba(15, 23, 42, 0.10)',
+
+    # Active character: accent (teal)
+    'highlight': '#0F766E',
+    'highlight_bg': 'rgba(15, 118, 110, 0.18)',
+
+    'error': '#D64545',
+    'error_bg': 'rgba(214, 69, 69, 0.18)',
+    'success': '#2F855A',
+    'success_bg': 'rgba(47, 133, 90, 0.18)',
+    'progress': '#0F766E',
+
+    # Kept for compatibility with older styles
+    'key_bg': 'rgba(255, 255, 255, 0.22)',
+    'key_highlight': '#0F766E',
+    'key_highlight_bg': 'rgba(15, 118, 110, 0.18)',
+    'key_shift': '#0F766E',
+    'key_shift_bg': 'rgba(15, 118, 110, 0.18)',
+})
+# Opening <span> tags for the task display, formatted once instead of on every keystroke.
+_TASK_DONE_SPAN = f'<span style="color:{_THEME_COLORS["success"]};">'
+_TASK_CURRENT_SPAN = (
+    f'<span style="background:{_THEME_COLORS["highlight_bg"]}; color:{_THEME_COLORS["highlight"]}; '
+    'font-weight:600; padding:2px 4px; border-radius:4px;">'
+)
+_TASK_ERROR_SPAN = (
+    f'<span style="background:{_THEME_COLORS["error_bg"]}; color:{_THEME_COLORS["error"]}; '
+    'font-weight:600; padding:2px 4px; border-radius:4px;">'
+)
+_TASK_UPCOMING_SPAN = f'<span style="color:{_THEME_COLORS["text_muted"]};">'
+# Finger color palette (hand, finger) -> hex color.
+_FINGER_COLORS: Mapping[tuple[str, str], str] = MappingProxyType({
+    ('left', 'pinky'): '#5C96EB',
+    ('left', 'ring'): '#EF6060',
+    ('left', 'middle'): '#2ECC71',
+    ('left', 'index'): '#7A5CEB',
+    ('left', 'thumb'): '#EB78D2',
+    ('right', 'pinky'): '#5C96EB',
+    ('right', 'ring'): '#EF6060',
+    ('right', 'middle'): '#2ECC71',
+    ('right', 'index'): '#FF953D',
+    ('right', 'thumb'): '#EB78D2',
+})
+
+
+# One sheet on the main window for the static labels and buttons of both screens: children
+# are matched by object name / "role" property, so Qt parses these rules once instead of
+# once per styled widget.
+_WINDOW_QSS = f"""
+    QMainWindow {{
+        background: {_THEME_COLORS['bg_main']};
+    }}
+    QLabel#homeTitle {{ color: {HomeColors.PRIMARY}; font-size: 28px; font-weight: 900; }}
+    QLabel#homeSubtitle {{
+        color: {HomeColors.TEXT_SECONDARY};
+        font-size: 12px;
+        letter-spacing: 4px;
+        font-weight: 600;
+    }}
+    QLabel#homeDeco {{ font-size: 34px; }}
+    QLabel[role="panelTitle"] {{ color: {HomeColors.TEXT_PRIMARY}; font-size: 16px; font-weight: 900; }}
+    QLabel[role="panelCaption"] {{ color: {HomeColors.TEXT_SECONDARY}; font-size: 12px; font-weight: 800; }}
+    QLabel#homeAccuracyValue {{ color: {HomeColors.TEXT_PRIMARY}; font-size: 12px; font-weight: 900; }}
+    QPushButton#homeResetButton {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 {HomeColors.PRIMARY_LIGHT}, stop:1 {HomeColors.PRIMARY});
+        color: white;
+        padding: 12px 16px;
+        border: none;
+        border-radius: 16px;
+        font-weight: 900;
+        font-size: 13px;
+    }}
+    QPushButton#homeAboutButton {{
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+            stop:0 {HomeColors.PRIMARY_LIGHT}, stop:1 {HomeColors.PRIMARY});
+        color: white;
+        border: none;
+        border-radius: 14px;
+    }}
+    QPushButton#homeResetButton:hover, QPushButton#homeAboutButton:hover {{ background: {HomeColors.PRIMARY}; }}
+    QPushButton#homeResetButton:pressed, QPushButton#homeAboutButton:pressed {{ background: {HomeColors.PRIMARY_DARK}; }}
+    QLabel#homeFooter {{ color: rgba(26, 58, 58, 0.45); font-size: 11px; font-weight: 700; }}
+
+    QPushButton#typingBackButton {{
+        border: 1px solid rgba(0,131,143,0.2);
+        border-radius: 12px;
+        color: {HomeColors.PRIMARY};
+        font-size: 14px;
+        font-weight: 600;
+        padding: 0 24px;
+    }}
+    QPushButton#typingBackButton:hover {{ background: white; border-color: {HomeColors.PRIMARY}; }}
+    QLabel#typingTitle {{ color: white; font-size: 15px; font-weight: 800; }}
+    QLabel[role="statCaption"] {{ color: {HomeColors.TEXT_MUTED}; font-size: 12px; }}
+    QLabel[role="statNote"] {{ color: {HomeColors.TEXT_MUTED}; font-size: 11px; }}
+    QLabel#typingTime {{ color: {HomeColors.PRIMARY}; font-size: 36px; font-weight: 900; font-family: monospace; }}
+    QLabel#typingWpm {{ color: {HomeColors.PRIMARY}; font-size: 36px; font-weight: 900; }}
+    QLabel#typingAccuracy {{ color: {HomeColors.PRIMARY}; font-size: 18px; font-weight: 900; }}
+    QLabel#typingStreak {{ color: {HomeColors.TEXT_PRIMARY}; font-size: 36px; font-weight: 900; }}
+    QLabel#typingBestStreak {{ color: {HomeColors.TEXT_MUTED}; font-size: 14px; }}
+    QLabel#typingCorrect {{ color: #2e7d32; font-size: 28px; font-weight: 900; }}
+    QLabel#typingWrong {{ color: #c62828; font-size: 28px; font-weight: 900; }}
+    QFrame#typingScoreDivider {{ background: rgba(0,0,0,0.1); }}
+    QLabel#typingFeedback {{ color: {HomeColors.TEXT_SECONDARY}; font-size: 16px; font-weight: 600; }}
+    QWidget#typingBottom {{ background: transparent; border-radius: 16px; padding: 16px; }}
+"""
 
 
 class MainWindow(QMainWindow):
@@ -87,13 +326,12 @@ class MainWindow(QMainWindow):
 
         # Keystroke tracking
         self._keystroke_tracker = KeystrokeTracker()
-        self._tamil99_layout = Tamil99KeyboardLayout()
-        self._keycaps_map, self._char_to_key = self._load_tamil99_maps()
-        self._keystroke_sequence: list[tuple[str, bool]] = []  # (key, needs_shift)
+        self._keycaps_map = self._load_tamil99_keycaps()
+        self._keystroke_sequence: tuple[tuple[str, bool], ...] = ()  # (key, needs_shift)
         self._keystroke_index: int = 0
-        self._char_to_keystroke_map: dict[int, int] = {}  # char_index -> keystroke_index
         self._typed_keystrokes: list[str] = []  # Track actual keys pressed
         self._typed_tamil_text: str = ""  # Track typed Tamil text
+        self._typed_text_by_count: tuple[str, ...] = ("",)  # keystrokes typed -> Tamil text
         
         # Store references for adaptive layout
         self._keyboard_widget: Optional[QWidget] = None
@@ -103,6 +341,11 @@ class MainWindow(QMainWindow):
         self._keyboard_font_sizes: dict[str, int] = {}  # Store current font sizes
         self._finger_guidance_label: Optional[QLabel] = None
         self._key_base_style_by_label: dict[QLabel, str] = {}
+        # Key stylesheets by (key, font px, border px, border color, weight); few distinct combinations.
+        self._key_style_cache: dict[tuple[str, int, int, str, int], str] = {}
+        self._default_font_family = QApplication.font().family()
+        # CSS declaration shared by every key and input stylesheet built at runtime.
+        self._font_family_css = f"font-family: '{self._default_font_family}', sans-serif;"
 
         # Multi-screen navigation
         self._stack: Optional[QStackedWidget] = None
@@ -110,6 +353,7 @@ class MainWindow(QMainWindow):
         self._typing_screen: Optional[QWidget] = None
         self._back_button: Optional[QPushButton] = None
         self._typing_title_label: Optional[QLabel] = None
+        self._typing_feedback_label: Optional[QLabel] = None
 
         # Typing screen: practice UI (letter sequence, hero, stats panel)
         self._letter_sequence_widget: Optional[LetterSequenceWidget] = None
@@ -123,10 +367,9 @@ class MainWindow(QMainWindow):
         self._typing_correct_label: Optional[QLabel] = None
         self._typing_wrong_label: Optional[QLabel] = None
         self._typing_stats_timer: Optional[QTimer] = None
+        self._adaptive_layout_timer: Optional[QTimer] = None
 
         # Home screen widgets
-        self._header_datetime_label: Optional[QLabel] = None
-        self._header_timer: Optional[QTimer] = None
         self._level_map: Optional[LevelMapWidget] = None  # legacy (older home UI)
         self._points_card: Optional[HomeStatCard] = None
         self._streak_card: Optional[HomeStatCard] = None
@@ -137,232 +380,94 @@ class MainWindow(QMainWindow):
         self._levels_scroll: Optional[QScrollArea] = None
         self._levels_list_container: Optional[QWidget] = None
         self._home_levels_layout: Optional[QVBoxLayout] = None
+        self._home_level_cards: dict[str, HomeLevelRowCard] = {}  # level key -> row card, in list order
         
         # Invalid input overlay (red flash)
-        self._error_overlay: Optional[QWidget] = None
-        self._error_overlay_effect: Optional[QGraphicsOpacityEffect] = None
-        self._error_overlay_anim: Optional[QPropertyAnimation] = None
-        
-        # Finger mapping for QWERTY/Tamil99 layout
-        self._key_to_finger = self._build_finger_mapping()
+        self._error_overlay: Optional[ErrorFlashOverlay] = None
 
         self._build_ui()
         self._refresh_levels_list()
         QTimer.singleShot(0, self.showMaximized)
 
     
-    def _build_finger_mapping(self) -> dict[str, tuple[str, str]]:
-        """Build mapping from key to (hand, finger) tuple.
-        
-        Returns:
-            dict mapping key name to (hand, finger) where:
-            - hand: 'left' or 'right'
-            - finger: 'thumb', 'index', 'middle', 'ring', 'pinky'
-        """
-        mapping: dict[str, tuple[str, str]] = {}
-        # Left hand - Pinky
-        for key in ['`', '1', 'Q', 'A', 'Z', 'TAB', 'CAPS']:
-            mapping[key.upper()] = ('left', 'pinky')
-        mapping['SHIFT'] = ('left', 'pinky')  # Left shift (default, can be overridden)
-        
-        # Left hand - Ring
-        for key in ['2', 'W', 'S', 'X']:
-            mapping[key.upper()] = ('left', 'ring')
-        
-        # Left hand - Middle
-        for key in ['3', 'E', 'D', 'C']:
-            mapping[key.upper()] = ('left', 'middle')
-        
-        # Left hand - Index
-        for key in ['4', '5', 'R', 'T', 'F', 'G', 'V', 'B']:
-            mapping[key.upper()] = ('left', 'index')
-        
-        # Left hand - Thumb (Space bar left side)
-        mapping['SPACE'] = ('left', 'thumb')
-        mapping[' '] = ('left', 'thumb')  # Space as character
-        
-        # Right hand - Index
-        for key in ['6', '7', 'Y', 'U', 'H', 'J', 'N', 'M']:
-            mapping[key.upper()] = ('right', 'index')
-        
-        # Right hand - Middle
-        for key in ['8', 'I', 'K', ',']:
-            mapping[key.upper()] = ('right', 'middle')
-        
-        # Right hand - Ring
-        for key in ['9', 'O', 'L', '.']:
-            mapping[key.upper()] = ('right', 'ring')
-        
-        # Right hand - Pinky
-        for key in ['0', '-', '=', 'P', '[', ']', '\\', ';', "'", '/', 'ENTER', 'BACKSPACE']:
-            mapping[key.upper()] = ('right', 'pinky')
-        
-        # Special keys - Right shift (typically used more often)
-        mapping['SHIFT'] = ('right', 'pinky')  # Right shift is more common
-        
-        # Special keys
-        mapping['CTRL'] = ('left', 'pinky')  # Left Ctrl
-        mapping['ALT'] = ('left', 'thumb')  # Left Alt
-        
-        # Handle numeric row and symbols
-        # These follow the same pattern as letters above them
-        
-        return mapping
-    
-    def _get_finger_name(self, key_label: str, needs_shift: bool = False) -> tuple[str, str]:
+    @staticmethod
+    def _get_finger_name(key_label: str, needs_shift: bool = False) -> tuple[str, str]:
         """Get finger name for a key in both English and Tamil.
         
         Args:
             key_label: The key label (e.g., 'A', 'Space', 'Shift')
-            needs_shift: Whether Shift is required
+            needs_shift: Whether Shift is required (names the Shift finger instead)
             
         Returns:
             tuple of (english_name, tamil_name)
         """
-        # Handle Shift key separately
-        if key_label.upper() == 'SHIFT':
-            # If it's the Shift key itself, determine which shift based on context
-            # For now, default to right shift (pinky)
-            hand, finger = self._key_to_finger.get('SHIFT', ('right', 'pinky'))
-        elif needs_shift:
-            # Shift rule:
-            # - If the actual key is typed with LEFT hand -> use RIGHT shift
-            # - If the actual key is typed with RIGHT hand -> use LEFT shift
-            key_hand, _key_finger = self._key_to_finger.get(key_label.upper(), ('right', 'index'))
-            shift_hand = 'right' if key_hand == 'left' else 'left'
-            hand, finger = (shift_hand, 'pinky')
-        else:
-            # Regular key - get finger mapping
-            hand, finger = self._key_to_finger.get(key_label.upper(), ('right', 'index'))
-        
-        # Tamil finger names
-        finger_names_tamil = {
-            'thumb': 'கட்டைவிரல்',
-            'index': 'சுட்டுவிரல்',
-            'middle': 'நடுவிரல்',
-            'ring': 'மோதிரவிரல்',
-            'pinky': 'சிறுவிரல்'
-        }
-        
-        # Tamil hand names
-        hand_names_tamil = {
-            'left': 'இடது',
-            'right': 'வலது'
-        }
-        
-        english_name = f"{hand.capitalize()} {finger.capitalize()}"
-        tamil_name = f"{hand_names_tamil.get(hand, hand)} {finger_names_tamil.get(finger, finger)}"
-        
-        return (english_name, tamil_name)
+        return _key_guidance(key_label)[1 if needs_shift else 0]
 
-    def _shift_side_for_key(self, key_label: str) -> str:
+    @staticmethod
+    def _shift_side_for_key(key_label: str) -> str:
         """Return which Shift side to use for a given key label ('left' or 'right')."""
-        key_hand, _ = self._key_to_finger.get(key_label.upper(), ('right', 'index'))
-        return 'right' if key_hand == 'left' else 'left'
+        return _key_guidance(key_label)[2]
 
-    def _get_theme_colors(self) -> dict:
+    def _get_theme_colors(self) -> Mapping[str, str]:
         """Get light theme color palette"""
-        return {
-            # Background: neutral light grey with soft teal tint
-            'bg_main': '#EEF6F6',
-            'bg_container': 'rgba(255, 255, 255, 0.34)',
-            'bg_card': 'rgba(255, 255, 255, 0.24)',
-            'bg_input': 'rgba(255, 255, 255, 0.38)',
-            'bg_hover': 'rgba(255, 255, 255, 0.46)',
-
-            # Typing text: dark neutral
-            'text_primary': '#1F2933',
-            'text_secondary': '#334155',
-            'text_muted': '#64748B',
-
-            'border': 'rgba(15, 23, 42, 0.14)',
-            'border_light': 'rgba(15, 23, 42, 0.10)',
-
-            # Active character: accent (teal)
-            'highlight': '#0F766E',
-            'highlight_bg': 'rgba(15, 118, 110, 0.18)',
-
-            'error': '#D64545',
-            'error_bg': 'rgba(214, 69, 69, 0.18)',
-            'success': '#2F855A',
-            'success_bg': 'rgba(47, 133, 90, 0.18)',
-            'progress': '#0F766E',
-
-            # Kept for compatibility with older styles
-            'key_bg': 'rgba(255, 255, 255, 0.22)',
-            'key_highlight': '#0F766E',
-            'key_highlight_bg': 'rgba(15, 118, 110, 0.18)',
-            'key_shift': '#0F766E',
-            'key_shift_bg': 'rgba(15, 118, 110, 0.18)',
-        }
+        return _THEME_COLORS
 
-    def _get_finger_colors(self) -> dict[tuple[str, str], str]:
+    def _get_finger_colors(self) -> Mapping[tuple[str, str], str]:
         """Finger color palette (hand, finger) -> hex color."""
-        return {
-            ('left', 'pinky'): '#5C96EB',
-            ('left', 'ring'): '#EF6060',
-            ('left', 'middle'): '#2ECC71',
-            ('left', 'index'): '#7A5CEB',
-            ('left', 'thumb'): '#EB78D2',
-            ('right', 'pinky'): '#5C96EB',
-            ('right', 'ring'): '#EF6060',
-            ('right', 'middle'): '#2ECC71',
-            ('right', 'index'): '#FF953D',
-            ('right', 'thumb'): '#EB78D2',
-        }
+        return _FINGER_COLORS
 
-    def _darken_hex_color(self, hex_color: str, factor: float) -> str:
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _darken_hex_color(hex_color: str, factor: float) -> str:
         """Darken a hex color by multiplying RGB by factor (0..1)."""
-        try:
-            c = hex_color.strip()
-            if not c.startswith("#"):
-                return hex_color
-            if len(c) != 7:
-                return hex_color
-            factor = max(0.0, min(1.0, factor))
-            r = int(c[1:3], 16)
-            g = int(c[3:5], 16)
-            b = int(c[5:7], 16)
-            r = max(0, min(255, int(r * factor)))
-            g = max(0, min(255, int(g * factor)))
-            b = max(0, min(255, int(b * factor)))
-            return f"#{r:02X}{g:02X}{b:02X}"
-        except Exception:
+        c = hex_color.strip()
+        if not _HEX_COLOR.fullmatch(c):
             return hex_color
-
-    def _blend_hex_colors(self, a: str, b: str, t: float) -> str:
+        v = int(c[1:], 16)
+        factor = max(0.0, min(1.0, factor))
+        r = int((v >> 16) * factor)
+        g = int(((v >> 8) & 0xFF) * factor)
+        b = int((v & 0xFF) * factor)
+        return "#%06X" % (r << 16 | g << 8 | b)
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _blend_hex_colors(a: str, b: str, t: float) -> str:
         """Blend two #RRGGBB colors. t=0 -> a, t=1 -> b."""
-        try:
-            a = a.strip()
-            b = b.strip()
-            if not (a.startswith("#") and b.startswith("#") and len(a) == 7 and len(b) == 7):
-                return a
-            t = max(0.0, min(1.0, float(t)))
-            ar, ag, ab = int(a[1:3], 16), int(a[3:5], 16), int(a[5:7], 16)
-            br, bg, bb = int(b[1:3], 16), int(b[3:5], 16), int(b[5:7], 16)
-            r = int(ar + (br - ar) * t)
-            g = int(ag + (bg - ag) * t)
-            bl = int(ab + (bb - ab) * t)
-            return f"#{r:02X}{g:02X}{bl:02X}"
-        except Exception:
+        a = a.strip()
+        b = b.strip()
+        if not (_HEX_COLOR.fullmatch(a) and _HEX_COLOR.fullmatch(b)):
             return a
-
-    def _finger_color_for_key(self, key_label: str) -> str:
+        av = int(a[1:], 16)
+        bv = int(b[1:], 16)
+        t = max(0.0, min(1.0, float(t)))
+        ar, ag, ab = av >> 16, (av >> 8) & 0xFF, av & 0xFF
+        r = int(ar + ((bv >> 16) - ar) * t)
+        g = int(ag + (((bv >> 8) & 0xFF) - ag) * t)
+        bl = int(ab + ((bv & 0xFF) - ab) * t)
+        return "#%06X" % (r << 16 | g << 8 | bl)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _finger_color_for_key(key_label: str) -> str:
         """Return background color for a given key label."""
-        hand, finger = self._key_to_finger.get(key_label.upper(), ('right', 'index'))
-        return self._get_finger_colors().get((hand, finger), '#5C96EB')
+        hand, finger = _finger_for_key(key_label)
+        return _FINGER_COLORS.get((hand, finger), '#5C96EB')
 
-    def _muted_key_fill_color_for_key(self, key_label: str) -> str:
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _muted_key_fill_color_for_key(cls, key_label: str) -> str:
         """Muted/pastel version of the finger color for this key."""
-        colors = self._get_theme_colors()
-        base = self._finger_color_for_key(key_label)
+        base = cls._finger_color_for_key(key_label)
         # Blend towards window background to mute the color
-        return self._blend_hex_colors(base, colors['bg_main'], 0.62)
+        return cls._blend_hex_colors(base, _THEME_COLORS['bg_main'], 0.62)
 
-    def _highlight_border_color_for_key(self, key_label: str) -> str:
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _highlight_border_color_for_key(cls, key_label: str) -> str:
         """Border color for highlight that matches the finger palette (darker shade)."""
-        base = self._finger_color_for_key(key_label)
-        return self._darken_hex_color(base, 0.45)
+        base = cls._finger_color_for_key(key_label)
+        return cls._darken_hex_color(base, 0.45)
 
     def _build_key_style(
         self,
@@ -373,91 +478,40 @@ class MainWindow(QMainWindow):
         border_color: str = "transparent",
         font_weight: int = 500,
     ) -> str:
-        colors = self._get_theme_colors()
+        cache_key = (key_label, font_px, border_px, border_color, font_weight)
+        style = self._key_style_cache.get(cache_key)
+        if style is not None:
+            return style
         bg = self._muted_key_fill_color_for_key(key_label)
         border = f"{border_px}px solid {border_color}" if border_px > 0 else "none"
-        return f"""
+        style = f"""
             QLabel {{
                 background: {bg};
-                color: {colors['text_primary']};
+                color: {_THEME_COLORS['text_primary']};
                 border: {border};
                 border-radius: 6px;
                 padding: 12px 8px;
-                font-family: '{QApplication.font().family()}', sans-serif;
+                {self._font_family_css}
                 font-size: {font_px}px;
                 font-weight: {font_weight};
             }}
         """
-
-    def _calculate_keyboard_dimensions(self) -> tuple[float, int, int]:
-        """Calculate keyboard aspect ratio and optimal size based on screen size.
-        
-        Uses optimal dimensions from 1920x1200 screen (1402x424) as reference
-        and scales proportionally for other screen sizes.
-        
-        Returns:
-            tuple: (aspect_ratio, min_width, min_height)
-        """
-        screen = QGuiApplication.primaryScreen()
-        
-        # Reference dimensions from 1920x1200 screen that looked good
-        reference_screen_width = 1920
-        reference_keyboard_width = 1402
-        reference_keyboard_height = 424
-        reference_ratio = reference_keyboard_width / reference_keyboard_height  # ≈ 3.31
-        
-        if screen is None:
-            # Fallback to default dimensions if screen is not available
-            return (reference_ratio, 980, int(980 / reference_ratio))
-        
-        screen_width = screen.availableGeometry().width()
-        
-        # Calculate scale factor based on screen width
-        # Use screen width as primary dimension for scaling
-        scale_factor = screen_width / reference_screen_width
-        
-        # Calculate keyboard dimensions for current screen
-        # Ensure minimum size but scale up for larger screens
-        min_width = max(980, int(reference_keyboard_width * scale_factor))
-        min_height = int(min_width / reference_ratio)
-        
-        return (reference_ratio, min_width, min_height)
+        self._key_style_cache[cache_key] = style
+        return style
 
     def _build_ui(self) -> None:
         self.setWindowTitle("தட்டான் - தமிழ்99 பயிற்சி")
         self.setMinimumSize(1200, 800)
         
-        colors = self._get_theme_colors()
-        
-        # Set fallback background color
-        self.setStyleSheet(f"""
-            QMainWindow {{ 
-                background: {colors['bg_main']};
-            }}
-        """)
+        self.setStyleSheet(_WINDOW_QSS)
         
         # Create invalid input overlay (as child of main window to cover entire window)
-        self._error_overlay = QWidget(self)
-        self._error_overlay.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
-        self._error_overlay.setStyleSheet("background-color: #EF6060;")
-        self._error_overlay_effect = QGraphicsOpacityEffect(self._error_overlay)
-        self._error_overlay_effect.setOpacity(0.0)
-        self._error_overlay.setGraphicsEffect(self._error_overlay_effect)
-        self._error_overlay.hide()
-        # Create the animation ONCE and reuse it (prevents accumulating children)
-        self._error_overlay_anim = QPropertyAnimation(self._error_overlay_effect, b"opacity", self)
-        self._error_overlay_anim.setDuration(200)
-        self._error_overlay_anim.setKeyValueAt(0.0, 0.0)
-        self._error_overlay_anim.setKeyValueAt(0.2, 0.28)
-        self._error_overlay_anim.setKeyValueAt(1.0, 0.0)
-        self._error_overlay_anim.finished.connect(self._error_overlay.hide)
+        self._error_overlay = ErrorFlashOverlay(self)
 
         # ---- Multi-screen container ----
         self._stack = QStackedWidget()
         self._home_screen = CoolBackground()
-        self._typing_screen = CoolBackground()
         self._stack.addWidget(self._home_screen)
-        self._stack.addWidget(self._typing_screen)
         self.setCentralWidget(self._stack)
 
         self._about_overlay = AboutOverlay(self._stack)
@@ -466,6 +520,10 @@ class MainWindow(QMainWindow):
         self._reset_overlay.hide()
         self._level_completed_overlay = LevelCompletedOverlay(self._stack)
         self._level_completed_overlay.hide()
+        # Overlays are persistent and non-blocking: their results are handled by slots
+        # connected once here, instead of per-show connections and nested event loops.
+        self._reset_overlay.closed.connect(self._on_reset_overlay_closed)
+        self._level_completed_overlay.closed.connect(self._on_level_completed_overlay_closed)
 
         # ---- Home screen: Light theme glass UI (like `test.py`) ----
         home_layout = QVBoxLayout(self._home_screen)
@@ -489,11 +547,6 @@ class MainWindow(QMainWindow):
             }
             """
         )
-        logo_shadow = QGraphicsDropShadowEffect(logo)
-        logo_shadow.setBlurRadius(20)
-        logo_shadow.setOffset(0, 5)
-        logo_shadow.setColor(QColor(HomeColors.PRIMARY_DARK))
-        logo.setGraphicsEffect(logo_shadow)
         logo_layout = QVBoxLayout(logo)
         logo_layout.setContentsMargins(0, 0, 0, 0)
         logo_path = Path(__file__).resolve().parent.parent / "assets" / "logo" / "logo.svg"
@@ -508,21 +561,27 @@ class MainWindow(QMainWindow):
         logo_label.setAlignment(Qt.AlignCenter)
         logo_layout.addWidget(logo_label)
         header_row.addWidget(logo, 0)
+        # Baked shadow behind the logo's rounded square (corner radius 56/256 of 60px); the
+        # reduced alpha matches the falloff the blur-20 drop-shadow effect had. Created once
+        # the logo is in the header, so the header owns it.
+        logo_shadow_color = QColor(HomeColors.PRIMARY_DARK)
+        logo_shadow_color.setAlpha(200)
+        CardShadow(logo, radius=13, blur=20, offset_y=5, color=logo_shadow_color)
 
         title_widget = QWidget()
         title_col = QVBoxLayout(title_widget)
         title_col.setContentsMargins(8, 0, 0, 0)
         title_col.setSpacing(2)
         title = QLabel("தமிழ் தட்டச்சு பயிற்சி")
-        title.setStyleSheet(f"color: {HomeColors.PRIMARY}; font-size: 28px; font-weight: 900;")
+        title.setObjectName("homeTitle")
         subtitle = QLabel("TAMIL TYPING TUTOR")
-        subtitle.setStyleSheet(f"color: {HomeColors.TEXT_SECONDARY}; font-size: 12px; letter-spacing: 4px; font-weight: 600;")
+        subtitle.setObjectName("homeSubtitle")
         title_col.addWidget(title)
         title_col.addWidget(subtitle)
         header_row.addWidget(title_widget, 1)
         header_row.addStretch(1)
         deco = QLabel("⌨️")
-        deco.setStyleSheet("font-size: 34px;")
+        deco.setObjectName("homeDeco")
         header_row.addWidget(deco, 0, Qt.AlignRight)
         home_layout.addWidget(header, 0)
 
@@ -538,7 +597,7 @@ class MainWindow(QMainWindow):
         stats_layout.setSpacing(16)
 
         stats_title = QLabel("📊 முன்னேற்றம்")
-        stats_title.setStyleSheet(f"color: {HomeColors.TEXT_PRIMARY}; font-size: 16px; font-weight: 900;")
+        stats_title.setProperty("role", "panelTitle")
         stats_layout.addWidget(stats_title, 0)
 
         self._points_card = HomeStatCard("🏆", "புள்ளிகள்", "0", HomeColors.PRIMARY_LIGHT)
@@ -562,9 +621,9 @@ class MainWindow(QMainWindow):
         accuracy_row = QHBoxLayout()
         accuracy_row.setContentsMargins(0, 0, 0, 0)
         accuracy_label = QLabel("துல்லியம்")
-        accuracy_label.setStyleSheet(f"color: {HomeColors.TEXT_SECONDARY}; font-size: 12px; font-weight: 800;")
+        accuracy_label.setProperty("role", "panelCaption")
         self._accuracy_value_label = QLabel("0%")
-        self._accuracy_value_label.setStyleSheet(f"color: {HomeColors.TEXT_PRIMARY}; font-size: 12px; font-weight: 900;")
+        self._accuracy_value_label.setObjectName("homeAccuracyValue")
         accuracy_row.addWidget(accuracy_label)
         accuracy_row.addStretch(1)
         accuracy_row.addWidget(self._accuracy_value_label)
@@ -579,22 +638,7 @@ class MainWindow(QMainWindow):
         if restart_icon_path.exists():
             self.reset_button.setIcon(QIcon(str(restart_icon_path)))
         self.reset_button.setIconSize(QSize(18, 18))
-        self.reset_button.setStyleSheet(
-            f"""
-            QPushButton {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 {HomeColors.PRIMARY_LIGHT}, stop:1 {HomeColors.PRIMARY});
-                color: white;
-                padding: 12px 16px;
-                border: none;
-                border-radius: 16px;
-                font-weight: 900;
-                font-size: 13px;
-            }}
-            QPushButton:hover {{ background: {HomeColors.PRIMARY}; }}
-            QPushButton:pressed {{ background: {HomeColors.PRIMARY_DARK}; }}
-            """
-        )
+        self.reset_button.setObjectName("homeResetButton")
         self.reset_button.clicked.connect(self._reset_progress)
         stats_layout.addWidget(self.reset_button, 0)
 
@@ -610,19 +654,7 @@ class MainWindow(QMainWindow):
             about_btn.setIcon(QIcon(str(about_icon_path)))
         about_btn.setIconSize(QSize(22, 22))
         about_btn.setFixedSize(44, 44)
-        about_btn.setStyleSheet(
-            f"""
-            QPushButton {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 {HomeColors.PRIMARY_LIGHT}, stop:1 {HomeColors.PRIMARY});
-                color: white;
-                border: none;
-                border-radius: 14px;
-            }}
-            QPushButton:hover {{ background: {HomeColors.PRIMARY}; }}
-            QPushButton:pressed {{ background: {HomeColors.PRIMARY_DARK}; }}
-            """
-        )
+        about_btn.setObjectName("homeAboutButton")
         about_btn.setCursor(Qt.PointingHandCursor)
         about_btn.clicked.connect(self._show_about)
         bottom_row.addWidget(about_btn, 0)
@@ -639,9 +671,9 @@ class MainWindow(QMainWindow):
         levels_header = QHBoxLayout()
         levels_header.setContentsMargins(0, 0, 0, 0)
         levels_title = QLabel("🎯 நிலைகள்")
-        levels_title.setStyleSheet(f"color: {HomeColors.TEXT_PRIMARY}; font-size: 16px; font-weight: 900;")
+        levels_title.setProperty("role", "panelTitle")
         self._levels_summary_label = QLabel("")
-        self._levels_summary_label.setStyleSheet(f"color: {HomeColors.TEXT_SECONDARY}; font-size: 12px; font-weight: 800;")
+        self._levels_summary_label.setProperty("role", "panelCaption")
         levels_header.addWidget(levels_title)
         levels_header.addStretch(1)
         levels_header.addWidget(self._levels_summary_label)
@@ -656,6 +688,7 @@ class MainWindow(QMainWindow):
         self._home_levels_layout = QVBoxLayout(self._levels_list_container)
         self._home_levels_layout.setContentsMargins(0, 0, 0, 0)
         self._home_levels_layout.setSpacing(14)
+        self._home_level_cards = {}
         self._levels_scroll.setWidget(self._levels_list_container)
         levels_layout.addWidget(self._levels_scroll, 1)
 
@@ -665,15 +698,43 @@ class MainWindow(QMainWindow):
 
         footer_tagline = QLabel("செம்மொழித் தமிழ் கற்போம்")
         footer_tagline.setAlignment(Qt.AlignCenter)
-        footer_tagline.setStyleSheet(
-            f"""
-            color: rgba(26, 58, 58, 0.45);
-            font-size: 11px;
-            font-weight: 700;
-            """
-        )
+        footer_tagline.setObjectName("homeFooter")
         home_layout.addWidget(footer_tagline, 0)
 
+        # Start on home screen
+        self._stack.setCurrentWidget(self._home_screen)
+
+        self._update_error_overlay_geometry()
+
+        self.start_shortcut = QShortcut(Qt.CTRL | Qt.Key_Return, self)
+        self.start_shortcut.activated.connect(self._submit_task)
+
+        # The session clock only shows whole seconds: a coarse single-shot timer, re-armed
+        # for just after each new second (see _arm_typing_stats_timer).
+        self._typing_stats_timer = QTimer(self)
+        self._typing_stats_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._typing_stats_timer.setSingleShot(True)
+        self._typing_stats_timer.timeout.connect(self._on_typing_stats_tick)
+
+        # Window and keyboard-area resizes arrive in bursts while the window is dragged; each
+        # one restarts this timer, so the layout is adapted once the size has settled.
+        self._adaptive_layout_timer = QTimer(self)
+        self._adaptive_layout_timer.setSingleShot(True)
+        self._adaptive_layout_timer.setInterval(50)
+        self._adaptive_layout_timer.timeout.connect(self._adjust_adaptive_layout)
+
+    def _ensure_typing_screen(self) -> None:
+        """Build the typing screen the first time a level is opened.
+
+        The app starts on the home screen, so the practice area, stats panel and keyboard
+        are only created once the learner actually starts typing.
+        """
+        if self._typing_screen is not None:
+            return
+        colors = self._get_theme_colors()
+        self._typing_screen = CoolBackground()
+        self._stack.addWidget(self._typing_screen)
+
         # ---- Typing screen (header + left stats + practice area; finger/keyboard unchanged) ----
         typing_layout = QVBoxLayout(self._typing_screen)
         typing_layout.setContentsMargins(16, 16, 16, 16)
@@ -689,17 +750,7 @@ class MainWindow(QMainWindow):
         self._back_button = QPushButton("← நிலைகள்")
         self._back_button.setCursor(Qt.PointingHandCursor)
         self._back_button.setFixedHeight(48)
-        self._back_button.setStyleSheet(f"""
-            QPushButton {{
-                border: 1px solid rgba(0,131,143,0.2);
-                border-radius: 12px;
-                color: {HomeColors.PRIMARY};
-                font-size: 14px;
-                font-weight: 600;
-                padding: 0 24px;
-            }}
-            QPushButton:hover {{ background: white; border-color: {HomeColors.PRIMARY}; }}
-        """)
+        self._back_button.setObjectName("typingBackButton")
         self._back_button.clicked.connect(self._show_home_screen)
         header_row.addWidget(self._back_button, 0)
         header_row.addStretch(1)
@@ -718,7 +769,7 @@ class MainWindow(QMainWindow):
         pill_layout.setContentsMargins(20, 0, 20, 0)
         pill_layout.setSpacing(10)
         self._typing_title_label = QLabel("")
-        self._typing_title_label.setStyleSheet("color: white; font-size: 15px; font-weight: 800;")
+        self._typing_title_label.setObjectName("typingTitle")
         pill_layout.addWidget(self._typing_title_label)
         header_row.addWidget(level_pill, 0)
         header_row.addStretch(1)
@@ -739,10 +790,10 @@ class MainWindow(QMainWindow):
         time_layout = QVBoxLayout(time_card)
         time_layout.setContentsMargins(20, 16, 20, 16)
         time_label = QLabel("⏱️ நேரம்")
-        time_label.setStyleSheet(f"color: {HomeColors.TEXT_MUTED}; font-size: 12px;")
+        time_label.setProperty("role", "statCaption")
         time_layout.addWidget(time_label)
         self._typing_time_label = QLabel("0:00")
-        self._typing_time_label.setStyleSheet(f"color: {HomeColors.PRIMARY}; font-size: 36px; font-weight: 900; font-family: monospace;")
+        self._typing_time_label.setObjectName("typingTime")
         time_layout.addWidget(self._typing_time_label)
         stats_layout.addWidget(time_card)
 
@@ -750,13 +801,13 @@ class MainWindow(QMainWindow):
         wpm_layout = QVBoxLayout(wpm_card)
         wpm_layout.setContentsMargins(20, 16, 20, 16)
         wpm_label = QLabel("⚡ WPM")
-        wpm_label.setStyleSheet(f"color: {HomeColors.TEXT_MUTED}; font-size: 12px;")
+        wpm_label.setProperty("role", "statCaption")
         wpm_layout.addWidget(wpm_label)
         self._typing_wpm_label = QLabel("0")
-        self._typing_wpm_label.setStyleSheet(f"color: {HomeColors.PRIMARY}; font-size: 36px; font-weight: 900;")
+        self._typing_wpm_label.setObjectName("typingWpm")
         wpm_layout.addWidget(self._typing_wpm_label)
         wpm_sublabel = QLabel("words per minute")
-        wpm_sublabel.setStyleSheet(f"color: {HomeColors.TEXT_MUTED}; font-size: 11px;")
+        wpm_sublabel.setProperty("role", "statNote")
         wpm_layout.addWidget(wpm_sublabel)
         stats_layout.addWidget(wpm_card)
 
@@ -766,11 +817,11 @@ class MainWindow(QMainWindow):
         acc_layout.setSpacing(10)
         acc_header = QHBoxLayout()
         acc_label = QLabel("🎯 துல்லியம்")
-        acc_label.setStyleSheet(f"color: {HomeColors.TEXT_MUTED}; font-size: 12px;")
+        acc_label.setProperty("role", "statCaption")
         acc_header.addWidget(acc_label)
         acc_header.addStretch(1)
         self._typing_accuracy_value = QLabel("0%")
-        self._typing_accuracy_value.setStyleSheet(f"color: {HomeColors.PRIMARY}; font-size: 18px; font-weight: 900;")
+        self._typing_accuracy_value.setObjectName("typingAccuracy")
         acc_header.addWidget(self._typing_accuracy_value)
         acc_layout.addLayout(acc_header)
         self._typing_accuracy_bar = HomeProgressBar()
@@ -782,14 +833,14 @@ class MainWindow(QMainWindow):
         streak_layout = QVBoxLayout(streak_card)
         streak_layout.setContentsMargins(20, 16, 20, 16)
         streak_label = QLabel("🔥 தொடர்ச்சி")
-        streak_label.setStyleSheet(f"color: {HomeColors.TEXT_MUTED}; font-size: 12px;")
+        streak_label.setProperty("role", "statCaption")
         streak_layout.addWidget(streak_label)
         streak_row = QHBoxLayout()
         self._typing_streak_label = QLabel("0")
-        self._typing_streak_label.setStyleSheet(f"color: {HomeColors.TEXT_PRIMARY}; font-size: 36px; font-weight: 900;")
+        self._typing_streak_label.setObjectName("typingStreak")
         streak_row.addWidget(self._typing_streak_label)
         self._typing_best_streak_label = QLabel("/ சிறந்தது 0")
-        self._typing_best_streak_label.setStyleSheet(f"color: {HomeColors.TEXT_MUTED}; font-size: 14px;")
+        self._typing_best_streak_label.setObjectName("typingBestStreak")
         streak_row.addWidget(self._typing_best_streak_label)
         streak_row.addStretch(1)
         streak_layout.addLayout(streak_row)
@@ -803,28 +854,28 @@ class MainWindow(QMainWindow):
         correct_layout.setContentsMargins(0, 0, 0, 0)
         correct_layout.setAlignment(Qt.AlignCenter)
         self._typing_correct_label = QLabel("0")
-        self._typing_correct_label.setStyleSheet(f"color: #2e7d32; font-size: 28px; font-weight: 900;")
+        self._typing_correct_label.setObjectName("typingCorrect")
         self._typing_correct_label.setAlignment(Qt.AlignCenter)
         correct_layout.addWidget(self._typing_correct_label)
         correct_sublabel = QLabel("சரி ✓")
-        correct_sublabel.setStyleSheet(f"color: {HomeColors.TEXT_MUTED}; font-size: 11px;")
+        correct_sublabel.setProperty("role", "statNote")
         correct_sublabel.setAlignment(Qt.AlignCenter)
         correct_layout.addWidget(correct_sublabel)
         score_layout.addWidget(correct_widget)
         divider = QFrame()
         divider.setFixedWidth(1)
-        divider.setStyleSheet("background: rgba(0,0,0,0.1);")
+        divider.setObjectName("typingScoreDivider")
         score_layout.addWidget(divider)
         wrong_widget = QWidget()
         wrong_layout = QVBoxLayout(wrong_widget)
         wrong_layout.setContentsMargins(0, 0, 0, 0)
         wrong_layout.setAlignment(Qt.AlignCenter)
         self._typing_wrong_label = QLabel("0")
-        self._typing_wrong_label.setStyleSheet(f"color: #c62828; font-size: 28px; font-weight: 900;")
+        self._typing_wrong_label.setObjectName("typingWrong")
         self._typing_wrong_label.setAlignment(Qt.AlignCenter)
         wrong_layout.addWidget(self._typing_wrong_label)
         wrong_sublabel = QLabel("தவறு ✗")
-        wrong_sublabel.setStyleSheet(f"color: {HomeColors.TEXT_MUTED}; font-size: 11px;")
+        wrong_sublabel.setProperty("role", "statNote")
         wrong_sublabel.setAlignment(Qt.AlignCenter)
         wrong_layout.addWidget(wrong_sublabel)
         score_layout.addWidget(wrong_widget)
@@ -846,7 +897,7 @@ class MainWindow(QMainWindow):
         practice_layout.addWidget(self._hero_letter_label, 0, Qt.AlignCenter)
 
         self._typing_feedback_label = QLabel("இந்த எழுத்தை தட்டச்சு செய்க")
-        self._typing_feedback_label.setStyleSheet(f"color: {HomeColors.TEXT_SECONDARY}; font-size: 16px; font-weight: 600;")
+        self._typing_feedback_label.setObjectName("typingFeedback")
         self._typing_feedback_label.setAlignment(Qt.AlignCenter)
         practice_layout.addWidget(self._typing_feedback_label)
 
@@ -883,11 +934,7 @@ class MainWindow(QMainWindow):
 
         # Single parent container for Finger UI and Keyboard (typing screen only)
         self._bottom_container = QWidget()
-        self._bottom_container.setStyleSheet("""
-            background: transparent;
-            border-radius: 16px;
-            padding: 16px;
-        """)
+        self._bottom_container.setObjectName("typingBottom")
         bottom_row = QHBoxLayout(self._bottom_container)
         bottom_row.setSpacing(15)
         bottom_row.setContentsMargins(0, 0, 0, 0)
@@ -902,18 +949,16 @@ class MainWindow(QMainWindow):
         self._finger_guidance_label.setAlignment(Qt.AlignCenter)
         self._finger_guidance_label.setWordWrap(True)
         self._finger_guidance_label.setTextFormat(Qt.RichText)
-        self._finger_guidance_label.setStyleSheet(f"""
-            QLabel {{
-                background: transparent;
-                color: {colors['text_primary']};
-                border-radius: 10px;
-                padding: 12px 16px;
-                font-size: 16px;
-                font-weight: 600;
-                font-family: '{QApplication.font().family()}', sans-serif;
-                min-height: 50px;
-            }}
-        """)
+        # Font, palette and margins instead of a style sheet: no QSS parse or polish for this label.
+        guidance_font = QFont(self._default_font_family)
+        guidance_font.setPixelSize(16)
+        guidance_font.setWeight(QFont.Weight.DemiBold)
+        self._finger_guidance_label.setFont(guidance_font)
+        guidance_palette = self._finger_guidance_label.palette()
+        guidance_palette.setColor(QPalette.ColorRole.WindowText, QColor(colors['text_primary']))
+        self._finger_guidance_label.setPalette(guidance_palette)
+        self._finger_guidance_label.setContentsMargins(16, 12, 16, 12)
+        self._finger_guidance_label.setMinimumHeight(50 + 12 + 12)  # text area plus vertical margins
         self._finger_guidance_label.setVisible(False)
         finger_ui_layout.addWidget(self._finger_guidance_label, 0, Qt.AlignCenter)
 
@@ -925,7 +970,8 @@ class MainWindow(QMainWindow):
             initial_max_width = 600
             pixmap = self._original_hands_pixmap
             if pixmap.width() > initial_max_width:
-                pixmap = pixmap.scaledToWidth(initial_max_width, Qt.SmoothTransformation)
+                # Same cache entry as the adaptive layout's widest size, so it is scaled only once.
+                pixmap = self._scaled_hands_pixmap(initial_max_width)
 
             self._hands_image_label.setPixmap(pixmap)
             self._hands_image_label.setAlignment(Qt.AlignCenter)
@@ -946,33 +992,8 @@ class MainWindow(QMainWindow):
         typing_layout.addWidget(self._bottom_container)
         self._bottom_container.installEventFilter(self)
 
-        # Start on home screen
-        self._stack.setCurrentWidget(self._home_screen)
-
-        self._update_error_overlay_geometry()
-
-        self.start_shortcut = QShortcut(Qt.CTRL | Qt.Key_Return, self)
-        self.start_shortcut.activated.connect(self._submit_task)
-
         self._apply_responsive_fonts()
 
-        # Header clock
-        if self._header_datetime_label is not None:
-            self._update_header_datetime()
-            self._header_timer = QTimer(self)
-            self._header_timer.timeout.connect(self._update_header_datetime)
-            self._header_timer.start(1000)
-
-        self._typing_stats_timer = QTimer(self)
-        self._typing_stats_timer.timeout.connect(self._update_typing_stats_panel)
-
-    def _update_header_datetime(self) -> None:
-        if self._header_datetime_label is None:
-            return
-        # Similar to reference: "Monday, February 2, 2026 at 10:26:38 PM IST"
-        now = QDateTime.currentDateTime()
-        self._header_datetime_label.setText(now.toString("dddd, MMMM d, yyyy 'at' hh:mm:ss AP t"))
-
     def _aggregate_best_accuracy(self) -> float:
         """Best recorded accuracy across all levels (0..100)."""
         best = 0.0
@@ -993,22 +1014,17 @@ class MainWindow(QMainWindow):
 
         # Update right-panel list (new home UI)
         if self._home_levels_layout is not None:
-            # Clear old widgets
-            while self._home_levels_layout.count():
-                item = self._home_levels_layout.takeAt(0)
-                w = item.widget()
-                if w is not None:
-                    w.setParent(None)
-                    w.deleteLater()
-
-            icon_map = {0: "அ", 1: "ஆ", 2: "க்", 3: "கா", 4: "📝"}
-            name_map = {
-                0: "அடிப்படை எழுத்துகள்",
-                1: "எளிய சொற்கள்",
-                2: "எளிய வாக்கியங்கள்",
-                3: "நடுத்தர வாக்கியங்கள்",
-                4: "நீளமான வாக்கியங்கள்",
-            }
+            # Rows are rebuilt only when the set of levels changes; otherwise each card is updated
+            # in place, which is what every progress refresh needs.
+            rebuild = list(self._home_level_cards) != [state.level.key for state in level_states]
+            if rebuild:
+                while self._home_levels_layout.count():
+                    item = self._home_levels_layout.takeAt(0)
+                    w = item.widget()
+                    if w is not None:
+                        w.setParent(None)
+                        w.deleteLater()
+                self._home_level_cards = {}
 
             completed_levels = 0
             for state in level_states:
@@ -1020,18 +1036,24 @@ class MainWindow(QMainWindow):
                 self._levels_summary_label.setText(f"{completed_levels}/{len(level_states)} நிறைவேற்றப்பட்டது")
 
             for idx, state in enumerate(level_states):
-                level_id = idx
-                try:
-                    m = re.match(r"^level(\d+)$", state.level.key)
-                    if m:
-                        level_id = int(m.group(1))
-                except Exception:
-                    level_id = idx
-
                 task_count = len(state.level.tasks)
-                title = name_map.get(level_id, state.level.name)
-                icon = icon_map.get(level_id, title[:1] if title else "•")
                 completed = state.completed >= task_count and task_count > 0
+                card = self._home_level_cards.get(state.level.key)
+                if card is not None:
+                    card.update_state(
+                        current=int(state.completed),
+                        total=int(task_count),
+                        unlocked=bool(state.unlocked),
+                        selected=bool(state.is_current),
+                        completed=completed,
+                    )
+                    continue
+
+                m = _LEVEL_KEY.fullmatch(state.level.key)
+                level_id = int(m.group(1)) if m else idx
+
+                title = _LEVEL_TITLES.get(level_id, state.level.name)
+                icon = _LEVEL_ICONS.get(level_id, title[:1] if title else "•")
                 card = HomeLevelRowCard(
                     level_key=state.level.key,
                     level_id=level_id,
@@ -1047,8 +1069,10 @@ class MainWindow(QMainWindow):
                     on_view=self._view_level,
                 )
                 self._home_levels_layout.addWidget(card)
+                self._home_level_cards[state.level.key] = card
 
-            self._home_levels_layout.addStretch(1)
+            if rebuild:
+                self._home_levels_layout.addStretch(1)
 
         # Keep left panel and gamification cards in sync with stored progress (home screen)
         self._update_gamification_stats()
@@ -1082,6 +1106,7 @@ class MainWindow(QMainWindow):
         self._start_level(level_key, view_only=True)
 
     def _start_level(self, level_key: str, view_only: bool = False) -> None:
+        self._ensure_typing_screen()
         self._view_only_session = view_only
         level = self._levels_repo.get(level_key)
         progress = self._progress_store.get_level_progress(level_key)
@@ -1099,7 +1124,7 @@ class MainWindow(QMainWindow):
             )
         self._start_session(level, progress.completed)
         if self._typing_title_label is not None:
-            level_id = re.sub(r"^level", "", level.key)
+            level_id = level.key.removeprefix("level")
             self._typing_title_label.setText(f"நிலை {level_id}: {level.name}")
         if self._typing_feedback_label is not None:
             if view_only:
@@ -1130,7 +1155,7 @@ class MainWindow(QMainWindow):
             self.input_box.setFocus()
         self._update_typing_stats_panel()
         if not self._view_only_session and self._typing_stats_timer is not None:
-            self._typing_stats_timer.start(1000)
+            self._arm_typing_stats_timer()
 
     def _sync_typing_panel_heights(self) -> None:
         """Match tutor area height to stats area, reduced by 40px so tutor is slightly shorter."""
@@ -1165,76 +1190,44 @@ class MainWindow(QMainWindow):
         self._current_task_text = self._session.current_task()
         self._task_display_offset = 0
         # Build keystroke sequence using Tamil99 layout
-        self._keystroke_sequence = self._tamil99_layout.get_keystroke_sequence(self._current_task_text)
+        self._keystroke_sequence, self._typed_text_by_count = self._compile_task(self._current_task_text)
         self._keystroke_index = 0
         self._typed_keystrokes = []
         self._typed_tamil_text = ""  # Track typed Tamil text
-        self._keystroke_to_char_map: dict[int, int] = {}  # keystroke_idx -> char_idx
-        self._build_keystroke_to_char_map()  # Build mapping from keystroke indices to character indices
         self._render_task_display("", self._current_task_text, is_error=False)
         self._set_input_text("")
         self.input_box.setFocus()
         self._update_keyboard_hint()
     
-    def _build_keystroke_to_char_map(self) -> None:
-        """Build mapping from keystroke indices to character indices"""
-        self._keystroke_to_char_map = {}
-        keystroke_idx = 0
-        target = self._current_task_text
-        i = 0
-        
-        # Process text the same way get_keystroke_sequence does
-        # to correctly handle combined characters
-        while i < len(target):
-            char = target[i]
-            
-            if char == ' ':
-                self._keystroke_to_char_map[keystroke_idx] = i
-                keystroke_idx += 1
-                i += 1
-            # Check for combined characters first (same logic as get_keystroke_sequence)
-            elif i + 1 < len(target):
-                combined = char + target[i + 1]
-                if combined in self._tamil99_layout.CHAR_TO_KEYSTROKES:
-                    # Found combined character (e.g., "து" = "ld")
-                    key_seq = self._tamil99_layout.CHAR_TO_KEYSTROKES[combined]
-                    # Map all keystrokes for this combined character to the first character index
-                    for _ in key_seq:
-                        self._keystroke_to_char_map[keystroke_idx] = i
-                        keystroke_idx += 1
-                    i += 2  # Skip both characters
-                    continue
-            # Single character
-            if char in self._tamil99_layout.CHAR_TO_KEYSTROKES:
-                key_seq = self._tamil99_layout.CHAR_TO_KEYSTROKES[char]
-                # Handle special prefixes
-                if key_seq.startswith('^#'):
-                    # Tamil numeral: ^#1
-                    self._keystroke_to_char_map[keystroke_idx] = i
-                    keystroke_idx += 1  # ^
-                    self._keystroke_to_char_map[keystroke_idx] = i
-                    keystroke_idx += 1  # #
-                    if len(key_seq) > 2:
-                        self._keystroke_to_char_map[keystroke_idx] = i
-                        keystroke_idx += 1  # number
-                elif key_seq.startswith('^'):
-                    # Vowel sign: ^q
-                    self._keystroke_to_char_map[keystroke_idx] = i
-                    keystroke_idx += 1  # ^
-                    if len(key_seq) > 1:
-                        self._keystroke_to_char_map[keystroke_idx] = i
-                        keystroke_idx += 1  # vowel key
-                else:
-                    # Regular sequence
-                    for _ in key_seq:
-                        self._keystroke_to_char_map[keystroke_idx] = i
-                        keystroke_idx += 1
-                i += 1
-            else:
-                # Fallback
-                self._keystroke_to_char_map[keystroke_idx] = i
-                keystroke_idx += 1
-                i += 1
+    @classmethod
+    @lru_cache(maxsize=512)
+    def _compile_task(cls, target: str) -> tuple[tuple[tuple[str, bool], ...], tuple[str, ...]]:
+        """Keystroke sequence for a task and the Tamil text shown after each number of them.
+
+        Only keystrokes matching the sequence are accepted, so the typed text depends on
+        nothing but how many have been typed; building every prefix once per task keeps
+        each keystroke (and backspace) a tuple lookup instead of a walk over the target.
+        Both depend on the task text alone and are shared by every visit to the task.
+        """
+        sequence = tuple(Tamil99KeyboardLayout.get_keystroke_sequence(target))
+        keys = ["Space" if key == " " else key for key, _ in sequence]
+
+        # One walk over the whole sequence, advanced as far as each prefix of n keystrokes can
+        # follow it: a step taken with all keystrokes is the step n of them take whenever it ends
+        # within those n. Only the character still being typed is matched separately per prefix.
+        full_walk = cls._match_typed_chars(target, keys, len(keys))
+        step = next(full_walk, None)
+        i = keystroke_idx = 0
+        text = ""
+        text_by_count = [""]
+        for n in range(1, len(keys) + 1):
+            while step is not None and keystroke_idx < n and step[1] <= n:
+                i, keystroke_idx, glyph = step
+                text += glyph
+                step = next(full_walk, None)
+            partial = "".join(glyph for _, _, glyph in cls._match_typed_chars(target, keys, n, i, keystroke_idx))
+            text_by_count.append(text + partial)
+        return sequence, tuple(text_by_count)
 
     def _set_input_text(self, text: str) -> None:
         self._auto_submit_block = True
@@ -1249,7 +1242,7 @@ class MainWindow(QMainWindow):
             return self._on_key_press(event)
         elif obj == self._bottom_container and event.type() == event.Type.Resize:
             # Handle resize events for adaptive layout
-            QTimer.singleShot(10, self._adjust_adaptive_layout)  # Delay to ensure size is updated
+            self._adaptive_layout_timer.start()
         return super().eventFilter(obj, event)
     
     def resizeEvent(self, event) -> None:
@@ -1258,7 +1251,8 @@ class MainWindow(QMainWindow):
         self._update_error_overlay_geometry()
         if self._stack is not None and self._stack.currentWidget() is self._typing_screen:
             QTimer.singleShot(0, self._sync_typing_panel_heights)
-        QTimer.singleShot(10, self._adjust_adaptive_layout)  # Delay to ensure size is updated
+        if self._adaptive_layout_timer is not None:
+            self._adaptive_layout_timer.start()
     
     def _adjust_adaptive_layout(self) -> None:
         """Adjust keyboard and finger UI sizes based on available space"""
@@ -1292,10 +1286,7 @@ class MainWindow(QMainWindow):
         if self._hands_image_label and self._original_hands_pixmap:
             current_width = self._hands_image_label.width()
             if abs(ideal_hands_width - current_width) > 10:  # Only update if significant change
-                scaled_pixmap = self._original_hands_pixmap.scaledToWidth(
-                    ideal_hands_width, Qt.SmoothTransformation
-                )
-                self._hands_image_label.setPixmap(scaled_pixmap)
+                self._hands_image_label.setPixmap(self._scaled_hands_pixmap(ideal_hands_width))
                 self._hands_image_label.setMinimumWidth(ideal_hands_width)
                 self._hands_image_label.setMaximumWidth(ideal_hands_width)
         
@@ -1303,6 +1294,15 @@ class MainWindow(QMainWindow):
         if keyboard_width > 0:
             self._update_keyboard_font_sizes(keyboard_width)
     
+    def _scaled_hands_pixmap(self, width: int) -> QPixmap:
+        """Hands image scaled to width; cached so resizing back to a width skips the smooth rescale."""
+        key = f"thattan-hands:{width}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = self._original_hands_pixmap.scaledToWidth(width, Qt.SmoothTransformation)
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+
     def _update_keyboard_font_sizes(self, keyboard_width: int) -> None:
         """Update keyboard font sizes based on available width"""
         if not self._keyboard_widget:
@@ -1335,33 +1335,24 @@ class MainWindow(QMainWindow):
             
             # Rebuild keyboard HTML with new font sizes
             self._rebuild_keyboard_labels()
-            
-            # Update special key labels
-            colors = self._get_theme_colors()
-            special_labels = {
-                "Backspace": "←",
-                "Tab": "Tab",
-                "Caps": "Caps Lock",
-                "Enter": "Enter",
-                "Shift": "Shift",
-                "Ctrl": "Ctrl",
-                "Alt": "Alt",
-                "Space": "Space",
-            }
-            
+
             # Update Space key
             if "Space" in self._key_labels:
                 space_label = self._key_labels["Space"]
                 style = self._build_key_style("Space", special_font, font_weight=500)
-                space_label.setStyleSheet(style)
+                self._apply_key_style(space_label, style)
                 self._key_base_style_by_label[space_label] = style
-            
+
             # Update shift labels
+            style = self._build_key_style("Shift", special_font, font_weight=500)
             for shift_label in self._shift_labels:
-                style = self._build_key_style("Shift", special_font, font_weight=500)
-                shift_label.setStyleSheet(style)
+                self._apply_key_style(shift_label, style)
                 self._key_base_style_by_label[shift_label] = style
-    
+
+            # Highlighted keys carry their own font size; redraw them at the new size.
+            if self._highlighted_keys:
+                self._update_keyboard_hint()
+
     def _on_key_press(self, event: QKeyEvent) -> bool:
         """Handle individual key press events"""
         if not self._session:
@@ -1439,96 +1430,90 @@ class MainWindow(QMainWindow):
 
     def _flash_invalid_input_overlay(self, duration_ms: int = 200) -> None:
         """Flash a short red overlay on invalid input."""
-        if not self._error_overlay or not self._error_overlay_effect or not self._error_overlay_anim:
+        # The overlay already tracks the window size (see resizeEvent).
+        if not self._error_overlay:
             return
-        
-        # Stop any running animation (we reuse the same object)
-        try:
-            self._error_overlay_anim.stop()
-        except Exception:
-            pass
-
-        self._update_error_overlay_geometry()
-        self._error_overlay.show()
-        self._error_overlay.raise_()
-
-        self._error_overlay_effect.setOpacity(0.0)
-        self._error_overlay_anim.setDuration(max(50, int(duration_ms)))
-        self._error_overlay_anim.start()
+        self._error_overlay.flash(max(50, int(duration_ms)))
     
     def _update_typed_tamil_text_from_keystrokes(self) -> None:
-        """Reconstruct Tamil text from typed keystrokes"""
-        # Process the target text and match keystrokes to characters
-        target = self._current_task_text
-        typed_ks_count = len(self._typed_keystrokes)
-        
-        # Reconstruct by processing target text character by character
-        reconstructed = ""
-        keystroke_idx = 0
-        i = 0
-        
+        """Look up the Tamil text for the keystrokes typed so far"""
+        self._typed_tamil_text = self._typed_text_by_count[len(self._typed_keystrokes)]
+
+    @classmethod
+    def _match_typed_chars(
+        cls, target: str, keystrokes: list[str], typed_ks_count: int, i: int = 0, keystroke_idx: int = 0
+    ) -> Iterator[tuple[int, int, str]]:
+        """Match the first typed_ks_count keystrokes against target, one character at a time.
+
+        Starts at target[i] / keystrokes[keystroke_idx] and yields (i, keystroke_idx, glyph) after
+        each step, where glyph is the text it adds (empty for a space that was not typed).
+        """
+        char_to_keystrokes = Tamil99KeyboardLayout.CHAR_TO_KEYSTROKES
+
         while i < len(target) and keystroke_idx < typed_ks_count:
             char = target[i]
             
             if char == ' ':
-                if keystroke_idx < typed_ks_count and self._typed_keystrokes[keystroke_idx] == "Space":
-                    reconstructed += " "
+                glyph = ""
+                if keystroke_idx < typed_ks_count and keystrokes[keystroke_idx] == "Space":
+                    glyph = " "
                     keystroke_idx += 1
                 i += 1
+                yield i, keystroke_idx, glyph
                 continue
             
             # Check for combined characters first
             elif i + 1 < len(target):
                 combined = char + target[i + 1]
-                if combined in self._tamil99_layout.CHAR_TO_KEYSTROKES:
-                    key_seq = self._tamil99_layout.CHAR_TO_KEYSTROKES[combined]
+                if combined in char_to_keystrokes:
+                    key_seq = char_to_keystrokes[combined]
                     # Check if we have enough keystrokes for this combined character
                     if keystroke_idx + len(key_seq) <= typed_ks_count:
                         # Verify the keystrokes match
                         matches = True
                         for j, expected_key in enumerate(key_seq):
-                            typed_key = self._typed_keystrokes[keystroke_idx + j].upper()
+                            typed_key = keystrokes[keystroke_idx + j].upper()
                             expected_key_upper = expected_key.upper()
                             if typed_key != expected_key_upper:
                                 matches = False
                                 break
                         if matches:
-                            reconstructed += combined
                             keystroke_idx += len(key_seq)
                             i += 2
+                            yield i, keystroke_idx, combined
                             continue
             
             # Single character
-            if char in self._tamil99_layout.CHAR_TO_KEYSTROKES:
-                key_seq = self._tamil99_layout.CHAR_TO_KEYSTROKES[char]
+            if char in char_to_keystrokes:
+                key_seq = char_to_keystrokes[char]
                 # Handle special prefixes
                 if key_seq.startswith('^#'):
                     # Tamil numeral: ^#1
                     required_keys = 3 if len(key_seq) > 2 else 2
                     if keystroke_idx + required_keys <= typed_ks_count:
                         # Verify keystrokes match
-                        if (self._typed_keystrokes[keystroke_idx].upper() == '^' and
+                        if (keystrokes[keystroke_idx].upper() == '^' and
                             keystroke_idx + 1 < typed_ks_count and
-                            self._typed_keystrokes[keystroke_idx + 1].upper() == '#'):
+                            keystrokes[keystroke_idx + 1].upper() == '#'):
                             if len(key_seq) > 2:
                                 if (keystroke_idx + 2 < typed_ks_count and
-                                    self._typed_keystrokes[keystroke_idx + 2].upper() == key_seq[2].upper()):
-                                    reconstructed += char
+                                    keystrokes[keystroke_idx + 2].upper() == key_seq[2].upper()):
                                     keystroke_idx += required_keys
                                     i += 1
+                                    yield i, keystroke_idx, char
                                     continue
                 elif key_seq.startswith('^'):
                     # Vowel sign: ^q
                     required_keys = 2 if len(key_seq) > 1 else 1
                     if keystroke_idx + required_keys <= typed_ks_count:
                         # Verify keystrokes match
-                        if self._typed_keystrokes[keystroke_idx].upper() == '^':
+                        if keystrokes[keystroke_idx].upper() == '^':
                             if len(key_seq) > 1:
                                 if (keystroke_idx + 1 < typed_ks_count and
-                                    self._typed_keystrokes[keystroke_idx + 1].upper() == key_seq[1].upper()):
-                                    reconstructed += char
+                                    keystrokes[keystroke_idx + 1].upper() == key_seq[1].upper()):
                                     keystroke_idx += required_keys
                                     i += 1
+                                    yield i, keystroke_idx, char
                                     continue
                 else:
                     # Regular sequence
@@ -1536,38 +1521,36 @@ class MainWindow(QMainWindow):
                         # Verify keystrokes match
                         matches = True
                         for j, expected_key in enumerate(key_seq):
-                            typed_key = self._typed_keystrokes[keystroke_idx + j].upper()
+                            typed_key = keystrokes[keystroke_idx + j].upper()
                             expected_key_upper = expected_key.upper()
                             if typed_key != expected_key_upper:
                                 matches = False
                                 break
                         if matches:
-                            reconstructed += char
                             keystroke_idx += len(key_seq)
                             i += 1
+                            yield i, keystroke_idx, char
                             continue
             else:
                 # Fallback for punctuation and other characters not in CHAR_TO_KEYSTROKES
                 # Check if the next keystroke matches this character
                 if keystroke_idx < typed_ks_count:
-                    typed_key = self._typed_keystrokes[keystroke_idx]
+                    typed_key = keystrokes[keystroke_idx]
                     # Get the expected key for this character using _map_char_to_key
-                    key_label, needs_shift = self._map_char_to_key(char)
+                    key_label, needs_shift = cls._map_char_to_key(char)
                     
                     # Check if typed key matches the expected key
                     # Normalize for comparison (handle both direct match and key label match)
                     if (typed_key == char or 
                         typed_key.upper() == char.upper() or
                         typed_key.upper() == key_label.upper()):
-                        reconstructed += char
                         keystroke_idx += 1
                         i += 1
+                        yield i, keystroke_idx, char
                         continue
             
             # If we can't match, break
             break
-        
-        self._typed_tamil_text = reconstructed
     
     def _update_display_from_keystrokes(self) -> None:
         """Update the display based on typed keystrokes"""
@@ -1701,39 +1684,33 @@ class MainWindow(QMainWindow):
         pct = round((idx / task_count) * 100) if task_count else 0
         self.progress_bar.setValue(idx)
 
+    def _arm_typing_stats_timer(self) -> None:
+        """Schedule the next stats refresh just after the session clock reaches a new second."""
+        if self._session is None or self._typing_stats_timer is None:
+            return
+        elapsed_ms = int((time.time() - self._session.start_time) * 1000)
+        self._typing_stats_timer.start(1000 - elapsed_ms % 1000 + 10)
+
+    def _on_typing_stats_tick(self) -> None:
+        self._update_typing_stats_panel()
+        self._arm_typing_stats_timer()
+
     def _level_completed(self) -> None:
         if self._typing_stats_timer is not None:
             self._typing_stats_timer.stop()
         self.task_display.setText("நிலை முடிந்தது! அடுத்த நிலையைத் தேர்வு செய்யவும்.")
         self._set_input_text("")
-        overlay = self._level_completed_overlay
-        overlay.setGeometry(self._stack.rect())
-        overlay.raise_()
-        overlay.show()
-        loop = QEventLoop()
-        overlay.closed.connect(loop.quit)
-        loop.exec()
-        overlay.closed.disconnect(loop.quit)
+        self._show_overlay(self._level_completed_overlay)
+
+    def _on_level_completed_overlay_closed(self) -> None:
         self._refresh_levels_list()
         self._clear_keyboard_highlight()
 
     def _reset_progress(self) -> None:
-        overlay = self._reset_overlay
-        overlay.setGeometry(self._stack.rect())
-        overlay.raise_()
-        overlay.show()
-        confirmed = [False]
-
-        def on_closed(ok: bool) -> None:
-            confirmed[0] = ok
-            loop.quit()
+        self._show_overlay(self._reset_overlay)
 
-        loop = QEventLoop()
-        overlay.closed.connect(on_closed)
-        loop.exec()
-        overlay.closed.disconnect(on_closed)
-
-        if confirmed[0]:
+    def _on_reset_overlay_closed(self, confirmed: bool) -> None:
+        if confirmed:
             self._progress_store.reset()
             self._total_score = 0
             self._current_streak = 0
@@ -1741,6 +1718,11 @@ class MainWindow(QMainWindow):
             self._update_gamification_stats()
             self._refresh_levels_list()
 
+    def _show_overlay(self, overlay: QWidget) -> None:
+        overlay.setGeometry(self._stack.rect())
+        overlay.raise_()
+        overlay.show()
+
     def closeEvent(self, event: QCloseEvent) -> None:
         """Persist progress when closing the app."""
         if self._progress_store is not None:
@@ -1748,14 +1730,7 @@ class MainWindow(QMainWindow):
         super().closeEvent(event)
 
     def _show_about(self) -> None:
-        overlay = self._about_overlay
-        overlay.setGeometry(self._stack.rect())
-        overlay.raise_()
-        overlay.show()
-        loop = QEventLoop()
-        overlay.closed.connect(loop.quit)
-        loop.exec()
-        overlay.closed.disconnect(loop.quit)
+        self._show_overlay(self._about_overlay)
 
     def _build_keyboard(self) -> QWidget:
         container = QWidget()
@@ -1879,19 +1854,19 @@ class MainWindow(QMainWindow):
                         '<table width="100%" height="100%" cellspacing="0" cellpadding="0" style="border-collapse:collapse;">'
                             '<tr>'
                                 f'<td style="padding-right:3px; vertical-align:top; text-align:left; '
-                                f'font-family:\'{QApplication.font().family()}\', sans-serif; '
+                                f'{self._font_family_css} '
                                 f'font-size:{english_font}px; color:{colors["text_primary"]}; ">{english}</td>'
 
                                 '<td style="width:5px;"></td>'
 
                                 f'<td style="padding-left:3px; vertical-align:top; text-align:right; '
-                                f'font-family:\'{QApplication.font().family()}\', sans-serif; '
+                                f'{self._font_family_css} '
                                 f'font-size:{tamil_shift_font}px; color:{colors["text_primary"]}; ">{tamil_shift}</td>'
                             '</tr>'
 
                             '<tr>'
                                 f'<td colspan="3" style="vertical-align:bottom; text-align:left; '
-                                f'font-family:\'{QApplication.font().family()}\', sans-serif; '
+                                f'{self._font_family_css} '
                                 f'font-size:{tamil_base_font}px; font-weight:600; color:{colors["text_primary"]}; ">{tamil_base}</td>'
                             '</tr>'
                         '</table>'
@@ -1956,16 +1931,16 @@ class MainWindow(QMainWindow):
                 '<table width="100%" height="100%" cellspacing="0" cellpadding="0" style="border-collapse:collapse;">'
                     '<tr>'
                         f'<td style="padding-right:3px; vertical-align:top; text-align:left; '
-                        f'font-family:\'{QApplication.font().family()}\', sans-serif; '
+                        f'{self._font_family_css} '
                         f'font-size:{english_font}px; color:{colors["text_primary"]}; ">{english}</td>'
                         '<td style="width:5px;"></td>'
                         f'<td style="padding-left:3px; vertical-align:top; text-align:right; '
-                        f'font-family:\'{QApplication.font().family()}\', sans-serif; '
+                        f'{self._font_family_css} '
                         f'font-size:{tamil_shift_font}px; color:{colors["text_primary"]}; ">{tamil_shift}</td>'
                     '</tr>'
                     '<tr>'
                         f'<td colspan="3" style="vertical-align:bottom; text-align:left; '
-                        f'font-family:\'{QApplication.font().family()}\', sans-serif; '
+                        f'{self._font_family_css} '
                         f'font-size:{tamil_base_font}px; font-weight:600; color:{colors["text_primary"]}; ">{tamil_base}</td>'
                     '</tr>'
                 '</table>'
@@ -1975,15 +1950,21 @@ class MainWindow(QMainWindow):
         for label in self._highlighted_keys:
             base_style = self._key_base_style_by_label.get(label)
             if base_style:
-                label.setStyleSheet(base_style)
+                self._apply_key_style(label, base_style)
         self._highlighted_keys = []
 
+    @staticmethod
+    def _apply_key_style(label: QLabel, style: str) -> None:
+        # Setting a style sheet re-parses it and re-polishes the label even when nothing changed.
+        if label.styleSheet() != style:
+            label.setStyleSheet(style)
+
     def _highlight_key(self, label: QLabel, key_label: str = "", is_shift: bool = False) -> None:
         font_px = self._keyboard_font_sizes.get('special', 18) if (is_shift or key_label in {"Shift", "Space", "Backspace", "Tab", "Caps", "Enter", "Ctrl", "Alt"}) else self._keyboard_font_sizes.get('base', 18)
         highlight_key = key_label or "Shift"
         border_color = self._highlight_border_color_for_key(highlight_key)
         style = self._build_key_style(highlight_key, font_px, border_px=4, border_color=border_color, font_weight=500)
-        label.setStyleSheet(style)
+        self._apply_key_style(label, style)
         self._highlighted_keys.append(label)
 
     def _update_keyboard_hint(self) -> None:
@@ -2040,7 +2021,7 @@ class MainWindow(QMainWindow):
                         border: 4px solid {border_color};
                         border-radius: 6px;
                         padding: 12px 8px;
-                        font-family: '{QApplication.font().family()}', sans-serif;
+                        {self._font_family_css}
                         font-size: {font_px}px;
                         font-weight: 500;
                     }}
@@ -2054,102 +2035,34 @@ class MainWindow(QMainWindow):
                 self._finger_guidance_label.setText(guidance_text)
                 self._finger_guidance_label.setVisible(True)
     
-    def _build_keystroke_sequence(self, text: str) -> list[tuple[str, bool]]:
-        """Build the keystroke sequence for Tamil99 text."""
-        sequence = []
-        self._char_to_keystroke_map = {}
-        keystroke_idx = 0
-        
-        for char_idx, char in enumerate(text):
-            # Get keystroke sequence from char_to_keystrokes mapping
-            if self._char_to_key and char in self._char_to_key:
-                key_seq = self._char_to_key[char]  # e.g., "oa" or "q" or "^d"
-                # Handle special sequences like "^d" or "^q"
-                # In Tamil99, "^" prefix means use the key after it (^d = press d, ^q = press q)
-                if key_seq.startswith("^"):
-                    # Extract the actual key after ^
-                    if len(key_seq) > 1:
-                        k = key_seq[1]
-                        is_upper = k.isupper()
-                        sequence.append((k.upper(), is_upper))
-                        self._char_to_keystroke_map[char_idx] = keystroke_idx
-                        keystroke_idx += 1
-                    else:
-                        # Just "^" - shouldn't happen, but handle it
-                        sequence.append(("^", False))
-                        self._char_to_keystroke_map[char_idx] = keystroke_idx
-                        keystroke_idx += 1
-                else:
-                    # Multi-character sequence like "oa" means press o then a
-                    # All keystrokes for this character map to the same char_idx
-                    for k in key_seq:
-                        is_upper = k.isupper()
-                        sequence.append((k.upper(), is_upper))
-                        keystroke_idx += 1
-                    # Map the character to the first keystroke of its sequence
-                    self._char_to_keystroke_map[char_idx] = keystroke_idx - len(key_seq)
-            else:
-                # Fallback for unmapped characters (spaces, punctuation)
-                if char == " ":
-                    sequence.append(("Space", False))
-                else:
-                    key_label, needs_shift = self._map_char_to_key(char)
-                    sequence.append((key_label, needs_shift))
-                self._char_to_keystroke_map[char_idx] = keystroke_idx
-                keystroke_idx += 1
-        
-        return sequence
-
-    def _map_char_to_key(self, char: str) -> tuple[str, bool]:
+    @staticmethod
+    def _map_char_to_key(char: str) -> tuple[str, bool]:
         # This is a fallback for non-Tamil characters (spaces, punctuation, etc.)
-        # Tamil characters should be handled in _build_keystroke_sequence using _char_to_key
+        # Tamil characters are handled by Tamil99KeyboardLayout.get_keystroke_sequence
         if char == " ":
             return "Space", False
 
         if char.isalpha():
             return char.upper(), char.isupper()
 
-        shift_map = {
-            "!": ("1", True),
-            "@": ("2", True),
-            "#": ("3", True),
-            "$": ("4", True),
-            "%": ("5", True),
-            "^": ("6", True),
-            "&": ("7", True),
-            "*": ("8", True),
-            "(": ("9", True),
-            ")": ("0", True),
-            "_": ("-", True),
-            "+": ("=", True),
-            "{": ("[", True),
-            "}": ("]", True),
-            "|": ("\\", True),
-            ":": (";", True),
-            "\"": ("'", True),
-            "<": (",", True),
-            ">": (".", True),
-            "?": ("/", True),
-            "~": ("`", True),
-        }
-        if char in shift_map:
-            return shift_map[char]
-
-        if char in {"`", "1", "2", "3", "4", "5", "6", "7", "8", "9", "0", "-", "=", "[", "]", "\\", ";", "'", ",", ".", "/"}:
-            return char.upper(), False
+        shifted = _SHIFTED_PUNCTUATION.get(char)
+        if shifted is not None:
+            return shifted
 
         return char.upper(), False
 
-    def _load_tamil99_maps(self) -> tuple[dict[str, tuple[str, Optional[str]]], dict[str, str]]:
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _load_tamil99_keycaps() -> dict[str, tuple[str, Optional[str]]]:
+        """Parse the m17n map once per process: key label -> (base, shifted) keycap text (read-only)."""
         mapping_path = Path(__file__).parent.parent / "data" / "m17n" / "ta-tamil99.mim"
         if not mapping_path.exists():
-            return {}, {}
+            return {}
 
         text = mapping_path.read_text(encoding="utf-8", errors="ignore")
         pattern = re.compile(r'\("([^"]+)"\s+(\?[^)]+|"[^"]*")\)')
 
         keycaps: dict[str, tuple[str, Optional[str]]] = {}
-        char_to_keystrokes: dict[str, str] = {}  # Tamil char -> keystroke sequence (e.g., "oa")
 
         for match in pattern.finditer(text):
             key_seq = match.group(1)  # Can be single or multi-character like "oa"
@@ -2183,34 +2096,6 @@ class MainWindow(QMainWindow):
                         base = out_value
                     keycaps[key_label] = (base, shift)
 
-            # Build reverse mapping: Tamil character -> keystroke sequence
-            # Only store mappings where output is EXACTLY that character (not a compound)
-            if len(out_value) == 1:
-                char_code = ord(out_value)
-                # Tamil Unicode range: 0B80-0BFF (includes all Tamil chars, combining marks, etc.)
-                if 0x0B80 <= char_code <= 0x0BFF:
-                    # Prefer shorter sequences, but prioritize single-character keys
-                    should_store = False
-                    if out_value not in char_to_keystrokes:
-                        should_store = True
-                    else:
-                        current_seq = char_to_keystrokes[out_value]
-                        # Prefer single-character sequences
-                        if len(key_seq) == 1 and len(current_seq) > 1:
-                            should_store = True
-                        # For pulli (்), prefer sequences ending with 'f'
-                        elif out_value == '்' and key_seq.endswith('f') and not current_seq.endswith('f'):
-                            should_store = True
-                        # For vowel signs, prefer sequences starting with '^'
-                        elif 0x0BBE <= char_code <= 0x0BFF and key_seq.startswith('^') and not current_seq.startswith('^'):
-                            should_store = True
-                        # Otherwise prefer shorter sequences
-                        elif len(key_seq) < len(current_seq):
-                            should_store = True
-                    
-                    if should_store:
-                        char_to_keystrokes[out_value] = key_seq
-
         tamil_digits = {
             "1": "௧",
             "2": "௨",
@@ -2228,9 +2113,8 @@ class MainWindow(QMainWindow):
             if not base:
                 base = tamil_digit
             keycaps[digit] = (base, shift)
-            char_to_keystrokes.setdefault(tamil_digit, digit)
 
-        return keycaps, char_to_keystrokes
+        return keycaps
 
     def _update_task_display_for_typed(self, typed: str, target: str, is_error: bool) -> None:
         if not target:
@@ -2248,8 +2132,6 @@ class MainWindow(QMainWindow):
                 self._hero_letter_label.setText("")
             return
 
-        colors = self._get_theme_colors()
-
         # Update letter sequence and hero (practice UI)
         letters = list(target)
         match_len = 0
@@ -2267,7 +2149,7 @@ class MainWindow(QMainWindow):
         
         if typed and typed == target:
             completed = html.escape(target)
-            html_text = f'<span style="color:{colors["success"]};">{completed}</span>'
+            html_text = f'{_TASK_DONE_SPAN}{completed}</span>'
             self.task_display.setText(html_text)
             return
         
@@ -2276,7 +2158,7 @@ class MainWindow(QMainWindow):
         
         if typed_len >= target_len:
             completed = html.escape(target)
-            html_text = f'<span style="color:{colors["success"]};">{completed}</span>'
+            html_text = f'{_TASK_DONE_SPAN}{completed}</span>'
             self.task_display.setText(html_text)
             return
         
@@ -2310,16 +2192,12 @@ class MainWindow(QMainWindow):
         remaining_escaped = html.escape(remaining)
         
         if not current_char and not remaining:
-            html_text = f'<span style="color:{colors["success"]};">{completed_escaped}</span>'
+            html_text = f'{_TASK_DONE_SPAN}{completed_escaped}</span>'
         else:
-            current_style = f"background:{colors['highlight_bg']}; color:{colors['highlight']}; font-weight:600; padding:2px 4px; border-radius:4px;"
-            if is_error:
-                current_style = f"background:{colors['error_bg']}; color:{colors['error']}; font-weight:600; padding:2px 4px; border-radius:4px;"
-            
             html_text = (
-                f'<span style="color:{colors["success"]};">{completed_escaped}</span>'
-                f'<span style="{current_style}">{current_char_escaped}</span>'
-                f'<span style="color:{colors["text_muted"]};">{remaining_escaped}</span>'
+                f'{_TASK_DONE_SPAN}{completed_escaped}</span>'
+                f'{_TASK_ERROR_SPAN if is_error else _TASK_CURRENT_SPAN}{current_char_escaped}</span>'
+                f'{_TASK_UPCOMING_SPAN}{remaining_escaped}</span>'
             )
 
         self.task_display.setText(html_text)
@@ -2339,7 +2217,7 @@ class MainWindow(QMainWindow):
                     padding: 24px 28px;
                     font-size: 26px;
                     font-weight: 400;
-                    font-family: '{QApplication.font().family()}', sans-serif;
+                    {self._font_family_css}
                 }}
             """)
         else:
@@ -2352,7 +2230,7 @@ class MainWindow(QMainWindow):
                     padding: 24px 28px;
                     font-size: 26px;
                     font-weight: 400;
-                    font-family: '{QApplication.font().family()}', sans-serif;
+                    {self._font_family_css}
                 }}
                 QLineEdit:focus {{
                     border: 2px solid {colors['highlight']};
@@ -2368,11 +2246,11 @@ class MainWindow(QMainWindow):
         task_size = max(16.0, height * 0.035)
         input_size = max(15.0, height * 0.03)
 
-        task_font = QFont(QApplication.font().family())
+        task_font = QFont(self._default_font_family)
         task_font.setPointSizeF(task_size)
         self.task_display.setFont(task_font)
 
-        input_font = QFont(QApplication.font().family())
+        input_font = QFont(self._default_font_family)
         input_font.setPointSizeF(input_size)
         self.input_box.setFont(input_font)
 
@@ -0,0 +1,110 @@
+"""Baked drop shadows for cards: blurred once, then drawn as a nine-slice behind the card."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from PySide6.QtCore import QEvent, QObject, QRect, QRectF, Qt
+from PySide6.QtGui import QBrush, QColor, QImage, QPainter, QPainterPath, QPen, QPixmap
+from PySide6.QtWidgets import QGraphicsBlurEffect, QGraphicsScene, QWidget
+
+# QGraphicsBlurEffect spreads about 2.5x wider than QGraphicsDropShadowEffect for the same
+# radius; scaling by this factor reproduces the drop-shadow look the cards were designed with.
+_BLUR_EFFECT_SCALE = 0.4
+
+
+@lru_cache(maxsize=None)
+def _shadow_tile(radius: int, blur: int, rgba: int) -> QPixmap:
+    """Blurred rounded-rect shadow, just large enough to be stretched as a nine-slice."""
+    core = 2 * (radius + blur) + 2
+    size = core + 2 * blur
+    scene = QGraphicsScene(0, 0, size, size)
+    path = QPainterPath()
+    path.addRoundedRect(QRectF(blur, blur, core, core), radius, radius)
+    item = scene.addPath(path, QPen(Qt.NoPen), QBrush(QColor(0, 0, 0)))
+    effect = QGraphicsBlurEffect()
+    effect.setBlurRadius(blur * _BLUR_EFFECT_SCALE)
+    item.setGraphicsEffect(effect)
+
+    image = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    scene.render(painter, QRectF(0, 0, size, size), QRectF(0, 0, size, size))
+    # Blur at full alpha, then tint: keeps the soft falloff of faint shadows free of banding.
+    painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
+    painter.fillRect(image.rect(), QColor.fromRgba(rgba))
+    painter.end()
+    return QPixmap.fromImage(image)
+
+
+class CardShadow(QWidget):
+    """Soft shadow painted behind a card, as a sibling widget stacked under it.
+
+    Replaces ``QGraphicsDropShadowEffect``, which renders the card and its children offscreen
+    and re-blurs them on every repaint. Here the blur runs once per (radius, blur, color) and
+    each repaint draws nine slices of the cached tile. The shadow follows the card's geometry,
+    visibility and parent, and is deleted with it.
+    """
+
+    def __init__(self, card: QWidget, *, radius: int, blur: int, offset_y: int, color: QColor) -> None:
+        super().__init__(card.parentWidget())
+        self._card = card
+        self._radius = radius
+        self._blur = blur
+        self._offset_y = offset_y
+        self._rgba = color.rgba()
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        card.installEventFilter(self)
+        card.destroyed.connect(self.deleteLater)
+        self._attach()
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        if obj is self._card:
+            event_type = event.type()
+            if event_type in (QEvent.Type.Move, QEvent.Type.Resize):
+                self._sync_geometry()
+            elif event_type in (QEvent.Type.Show, QEvent.Type.Hide):
+                self._sync_visibility()
+            elif event_type == QEvent.Type.ParentChange:
+                self._attach()
+            elif event_type == QEvent.Type.ZOrderChange and self.parentWidget() is not None:
+                self.stackUnder(self._card)
+        return False
+
+    def _attach(self) -> None:
+        parent = self._card.parentWidget()
+        if self.parentWidget() is not parent:
+            self.setParent(parent)
+        if parent is None:
+            # Never show as a top-level window while the card is not yet in a layout.
+            self.hide()
+            return
+        self.stackUnder(self._card)
+        self._sync_geometry()
+        self._sync_visibility()
+
+    def _sync_geometry(self) -> None:
+        m = self._blur
+        self.setGeometry(self._card.geometry().translated(0, self._offset_y).adjusted(-m, -m, m, m))
+
+    def _sync_visibility(self) -> None:
+        parent = self.parentWidget()
+        self.setVisible(parent is not None and self._card.isVisibleTo(parent))
+
+    def paintEvent(self, event) -> None:
+        tile = _shadow_tile(self._radius, self._blur, self._rgba)
+        corner = self._radius + 2 * self._blur
+        w, h = self.width(), self.height()
+        painter = QPainter(self)
+        if w < 2 * corner or h < 2 * corner:
+            # Too small to slice; a stretched tile is close enough for tiny widgets.
+            painter.drawPixmap(self.rect(), tile)
+            return
+        size = tile.width()
+        middle = size - 2 * corner
+        columns = ((0, corner, 0, corner), (corner, middle, corner, w - 2 * corner), (size - corner, corner, w - corner, corner))
+        rows = ((0, corner, 0, corner), (corner, middle, corner, h - 2 * corner), (size - corner, corner, h - corner, corner))
+        for sx, sw, dx, dw in columns:
+            for sy, sh, dy, dh in rows:
+                painter.drawPixmap(QRect(dx, dy, dw, dh), tile, QRect(sx, sy, sw, sh))
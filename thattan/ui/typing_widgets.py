@@ -1,15 +1,23 @@
-"""Typing practice UI: letter sequence and hero letter label."""
+"""Typing practice UI: letter sequence, hero letter label and invalid-input flash."""
 
 from __future__ import annotations
 
 from typing import Optional
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QAbstractAnimation, Qt, QVariantAnimation
 from PySide6.QtGui import QColor, QPainter, QPen
 from PySide6.QtWidgets import QLabel, QWidget
 
 from thattan.ui.colors import HomeColors
 
+# (box fill, box border, text color) per letter state, built once rather than on every paint.
+_DONE_COLORS = (QColor("#e8f5e9"), QPen(QColor(HomeColors.PRIMARY), 2), QColor(HomeColors.PRIMARY))
+_CURRENT_COLORS = (QColor("#e0f7fa"), QPen(QColor(HomeColors.PRIMARY), 2), QColor(HomeColors.PRIMARY))
+_UPCOMING_COLORS = (QColor(255, 255, 255, 100), QPen(QColor("#b0bec5"), 1), QColor("#b0bec5"))
+_ERROR_FLASH_RGB = (0xEF, 0x60, 0x60)
+# Peak alpha of the flash: 28% of the fill, reached 20% of the way through.
+_ERROR_FLASH_PEAK_ALPHA = 71
+
 
 class LetterSequenceWidget(QWidget):
     """Horizontal row of boxes: completed (✓), current (teal), upcoming (gray)."""
@@ -43,20 +51,16 @@ class LetterSequenceWidget(QWidget):
         for i, letter in enumerate(self._letters):
             x = start_x + i * (box_size + spacing)
             if i < self._current_index:
-                painter.setBrush(QColor("#e8f5e9"))
-                painter.setPen(QPen(QColor(HomeColors.PRIMARY), 2))
-                text_color = QColor(HomeColors.PRIMARY)
+                fill, border, text_color = _DONE_COLORS
                 display = "✓"
             elif i == self._current_index:
-                painter.setBrush(QColor("#e0f7fa"))
-                painter.setPen(QPen(QColor(HomeColors.PRIMARY), 2))
-                text_color = QColor(HomeColors.PRIMARY)
+                fill, border, text_color = _CURRENT_COLORS
                 display = letter
             else:
-                painter.setBrush(QColor(255, 255, 255, 100))
-                painter.setPen(QPen(QColor("#b0bec5"), 1))
-                text_color = QColor("#b0bec5")
+                fill, border, text_color = _UPCOMING_COLORS
                 display = letter
+            painter.setBrush(fill)
+            painter.setPen(border)
             painter.drawRoundedRect(x, y, box_size, box_size, 10, 10)
             painter.setPen(text_color)
             font = painter.font()
@@ -85,3 +89,44 @@ class HeroLetterLabel(QLabel):
             }}
             """
         )
+
+
+class ErrorFlashOverlay(QWidget):
+    """Translucent red fill that fades in and out over its parent on invalid input.
+
+    The fade only changes the fill's alpha, so each frame is a single fillRect instead of
+    the offscreen render and composite a QGraphicsOpacityEffect would need.
+    """
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
+        self._color = QColor(*_ERROR_FLASH_RGB, 0)
+        self._anim = QVariantAnimation(self)
+        self._anim.setKeyValueAt(0.0, 0)
+        self._anim.setKeyValueAt(0.2, _ERROR_FLASH_PEAK_ALPHA)
+        self._anim.setKeyValueAt(1.0, 0)
+        self._anim.valueChanged.connect(self._set_alpha)
+        self._anim.finished.connect(self.hide)
+        self.hide()
+
+    def flash(self, duration_ms: int) -> None:
+        if self._anim.state() == QAbstractAnimation.State.Running:
+            # Bursts of wrong keys rewind the running fade instead of restarting it; the
+            # alpha changes are repainted through update(), so Qt coalesces them.
+            self._anim.setCurrentTime(0)
+            return
+        self._anim.setDuration(duration_ms)
+        self.show()
+        self.raise_()
+        self._anim.start()
+
+    def _set_alpha(self, alpha: int) -> None:
+        if alpha != self._color.alpha():
+            self._color.setAlpha(alpha)
+            self.update()
+
+    def paintEvent(self, event) -> None:
+        if self._color.alpha():
+            QPainter(self).fillRect(self.rect(), self._color)